@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import Any
+
 from .handler.converter import ConversionRequest, ConversionResult, SoundConverter
-from .handler.mastering import (
-    MasteringEngine,
-    MasteringParameters,
-    MasteringRequest,
-    MasteringResult,
-)
-from .handler.trimmer import SilenceTrimmer, TrimRequest, TrimResult
+
+# The mastering and trimming handlers depend on pydub; they are imported on
+# first attribute access so FFmpeg-only callers never load it
+_LAZY_EXPORTS = {
+    "MasteringEngine": ".handler.mastering",
+    "MasteringParameters": ".handler.mastering",
+    "MasteringRequest": ".handler.mastering",
+    "MasteringResult": ".handler.mastering",
+    "SilenceTrimmer": ".handler.trimmer",
+    "TrimRequest": ".handler.trimmer",
+    "TrimResult": ".handler.trimmer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "SoundConverter",
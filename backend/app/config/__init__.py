@@ -4,11 +4,20 @@ This package centralizes all configuration settings and constants used
 throughout the backend application.
 """
 
-from .settings import AudioSettings, ProcessingSettings, AppSettings
+from .settings import AudioSettings, ProcessingSettings, AppSettings, get_settings
 from .constants import (
     AUDIO_FORMATS,
+    EXT_TO_FORMAT,
+    MIME_TO_FORMAT,
+    LOSSY_SET,
+    FORMAT_FLAGS,
     SAMPLE_RATES,
+    SAMPLE_RATE_SET,
+    SAMPLE_RATE_INDEX,
     BIT_DEPTHS,
+    BIT_DEPTH_SET,
+    BIT_DEPTH_INDEX,
+    Preset,
     PRESETS,
     EXIT_CODES
 )
@@ -17,9 +26,19 @@ __all__ = [
     "AudioSettings",
     "ProcessingSettings",
     "AppSettings",
+    "get_settings",
     "AUDIO_FORMATS",
+    "EXT_TO_FORMAT",
+    "MIME_TO_FORMAT",
+    "LOSSY_SET",
+    "FORMAT_FLAGS",
     "SAMPLE_RATES",
+    "SAMPLE_RATE_SET",
+    "SAMPLE_RATE_INDEX",
     "BIT_DEPTHS",
+    "BIT_DEPTH_SET",
+    "BIT_DEPTH_INDEX",
+    "Preset",
     "PRESETS",
     "EXIT_CODES",
 ]
@@ -3,6 +3,9 @@
 This module contains static constant definitions used across the backend.
 """
 
+from types import MappingProxyType
+from typing import NamedTuple
+
 # Audio Formats
 AUDIO_FORMATS = {
     "mp3": {"mime": "audio/mpeg", "ext": ".mp3", "lossy": True},
@@ -15,35 +18,58 @@ AUDIO_FORMATS = {
     "aiff": {"mime": "audio/x-aiff", "ext": ".aiff", "lossy": False},
 }
 
+# Reverse indices over AUDIO_FORMATS, built once at import
+EXT_TO_FORMAT = {spec["ext"]: key for key, spec in AUDIO_FORMATS.items()}
+MIME_TO_FORMAT = {spec["mime"]: key for key, spec in AUDIO_FORMATS.items()}
+LOSSY_SET = frozenset(key for key, spec in AUDIO_FORMATS.items() if spec["lossy"])
+
+# Per-format flag table (1 = lossy, 0 = lossless)
+FORMAT_FLAGS = {key: (1 if spec["lossy"] else 0) for key, spec in AUDIO_FORMATS.items()}
+
 # Valid Sample Rates (Hz)
 SAMPLE_RATES = [
     8000, 11025, 16000, 22050, 32000, 44100, 48000, 88200, 96000, 192000
 ]
 
+SAMPLE_RATE_SET = frozenset(SAMPLE_RATES)
+SAMPLE_RATE_INDEX = {rate: index for index, rate in enumerate(SAMPLE_RATES)}
+
 # Valid Bit Depths (bits)
 BIT_DEPTHS = [8, 16, 24, 32]
 
+BIT_DEPTH_SET = frozenset(BIT_DEPTHS)
+BIT_DEPTH_INDEX = {depth: index for index, depth in enumerate(BIT_DEPTHS)}
+
 # Mastering Presets
-PRESETS = {
-    "music": {
-        "target_lufs": -14.0,
-        "true_peak": -1.0,
-        "compression": True,
-        "eq_profile": "balanced"
-    },
-    "podcast": {
-        "target_lufs": -16.0,
-        "true_peak": -1.0,
-        "compression": True,
-        "eq_profile": "vocal_boost"
-    },
-    "voiceover": {
-        "target_lufs": -18.0,
-        "true_peak": -1.0,
-        "compression": True,
-        "eq_profile": "clarity"
-    }
-}
+class Preset(NamedTuple):
+    """Immutable mastering preset definition."""
+
+    target_lufs: float
+    true_peak: float
+    compression: bool
+    eq_profile: str
+
+
+PRESETS = MappingProxyType({
+    "music": Preset(
+        target_lufs=-14.0,
+        true_peak=-1.0,
+        compression=True,
+        eq_profile="balanced"
+    ),
+    "podcast": Preset(
+        target_lufs=-16.0,
+        true_peak=-1.0,
+        compression=True,
+        eq_profile="vocal_boost"
+    ),
+    "voiceover": Preset(
+        target_lufs=-18.0,
+        true_peak=-1.0,
+        compression=True,
+        eq_profile="clarity"
+    ),
+})
 
 # Process Exit Codes
 EXIT_CODES = {
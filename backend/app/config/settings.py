@@ -4,10 +4,23 @@ This module defines configuration classes for different aspects of the applicati
 Using classes allows for type safety and easy grouping of related settings.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
 
-@dataclass
+# ``slots=True`` is only understood by dataclasses on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_INPUT_EXTENSIONS = (
+    ".mp3", ".wav", ".aac", ".m4a", ".flac", ".ogg", ".wma", ".aiff", ".alac"
+)
+_OUTPUT_FORMATS = (
+    "mp3", "wav", "aac", "m4a", "flac", "ogg", "wma", "aiff"
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class AudioSettings:
     """Settings related to audio processing."""
     
@@ -23,18 +36,20 @@ class AudioSettings:
     # Maximum allowed file size in MB
     MAX_FILE_SIZE_MB: int = 2000
     
-    # Supported input formats (extensions)
-    SUPPORTED_INPUTS: List[str] = field(default_factory=lambda: [
-        ".mp3", ".wav", ".aac", ".m4a", ".flac", ".ogg", ".wma", ".aiff", ".alac"
-    ])
+    # Supported input formats (extensions), for membership tests
+    SUPPORTED_INPUTS: FrozenSet[str] = frozenset(_INPUT_EXTENSIONS)
+    
+    # Supported input formats in display order
+    SUPPORTED_INPUTS_ORDERED: Tuple[str, ...] = _INPUT_EXTENSIONS
     
-    # Supported output formats (extensions without dot)
-    SUPPORTED_OUTPUTS: List[str] = field(default_factory=lambda: [
-        "mp3", "wav", "aac", "m4a", "flac", "ogg", "wma", "aiff"
-    ])
+    # Supported output formats (extensions without dot), for membership tests
+    SUPPORTED_OUTPUTS: FrozenSet[str] = frozenset(_OUTPUT_FORMATS)
+    
+    # Supported output formats in display order
+    SUPPORTED_OUTPUTS_ORDERED: Tuple[str, ...] = _OUTPUT_FORMATS
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ProcessingSettings:
     """Settings related to the processing engine."""
     
@@ -54,7 +69,7 @@ class ProcessingSettings:
     TEMP_DIR_NAME: str = "harmonix_temp"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AppSettings:
     """Global application settings."""
     
@@ -64,3 +79,9 @@ class AppSettings:
     
     audio: AudioSettings = field(default_factory=AudioSettings)
     processing: ProcessingSettings = field(default_factory=ProcessingSettings)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Return the shared, immutable application settings instance."""
+    return AppSettings()
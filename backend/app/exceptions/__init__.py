@@ -2,27 +2,31 @@
 
 This package defines all custom exceptions used throughout the application
 to handle errors in a structured and predictable way.
+
+Only :class:`HarmonixError` is imported eagerly; the specialised exception
+modules are loaded on first attribute access.
 """
 
+import importlib
+from typing import Any
+
 from .base import HarmonixError
-from .validation_errors import (
-    ValidationError,
-    AudioValidationError,
-    ParameterError,
-    FormatError
-)
-from .processing_errors import (
-    ProcessingError,
-    ConversionError,
-    FFmpegError,
-    TimeoutError
-)
-from .file_errors import (
-    FileError,
-    FileAccessError,
-    FileNotFoundError,
-    FileTooLargeError
-)
+
+# Exception name -> submodule that defines it
+_LAZY_EXCEPTIONS = {
+    "ValidationError": "validation_errors",
+    "AudioValidationError": "validation_errors",
+    "ParameterError": "validation_errors",
+    "FormatError": "validation_errors",
+    "ProcessingError": "processing_errors",
+    "ConversionError": "processing_errors",
+    "FFmpegError": "processing_errors",
+    "TimeoutError": "processing_errors",
+    "FileError": "file_errors",
+    "FileAccessError": "file_errors",
+    "FileNotFoundError": "file_errors",
+    "FileTooLargeError": "file_errors",
+}
 
 __all__ = [
     "HarmonixError",
@@ -39,3 +43,20 @@ __all__ = [
     "FileNotFoundError",
     "FileTooLargeError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exception classes from their submodule on first access."""
+    module_name = _LAZY_EXCEPTIONS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily loaded exceptions in ``dir()`` output."""
+    return sorted(set(globals()) | set(__all__))
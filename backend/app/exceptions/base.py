@@ -1,5 +1,14 @@
 """Base exception class for the application."""
 
+import sys
+from typing import Optional
+
+# Shared keys for the serialized error payload
+_K_CODE = sys.intern("code")
+_K_MESSAGE = sys.intern("message")
+_K_DETAILS = sys.intern("details")
+
+
 class HarmonixError(Exception):
     """Base class for all Harmonix SE exceptions.
     
@@ -8,17 +17,22 @@ class HarmonixError(Exception):
         code: Machine-readable error code.
         details: Optional dictionary with debug details.
     """
+
+    # ``args`` stays on BaseException, which also keeps its own ``__dict__``
+    __slots__ = ("message", "code", "details")
+
+    _default_code = "INTERNAL_ERROR"
     
-    def __init__(self, message: str, code: str = "INTERNAL_ERROR", details: dict = None):
+    def __init__(self, message: str, code: Optional[str] = None, details: dict = None):
         super().__init__(message)
         self.message = message
-        self.code = code
-        self.details = details or {}
+        self.code = code or self._default_code
+        self.details = details if details is not None else {}
         
     def to_dict(self) -> dict:
         """Convert exception to dictionary for JSON response."""
         return {
-            "code": self.code,
-            "message": self.message,
-            "details": self.details
+            _K_CODE: self.code,
+            _K_MESSAGE: self.message,
+            _K_DETAILS: self.details
         }
@@ -4,34 +4,34 @@ from .base import HarmonixError
 
 class ProcessingError(HarmonixError):
     """Base class for processing errors."""
+    _default_code = "PROCESSING_ERROR"
+
     def __init__(self, message: str, details: dict = None):
-        super().__init__(message, code="PROCESSING_ERROR", details=details)
+        super().__init__(message, details=details)
 
 
 class ConversionError(ProcessingError):
     """Raised when audio conversion fails."""
-    def __init__(self, message: str, details: dict = None):
-        super().__init__(message, details=details)
-        self.code = "CONVERSION_FAILED"
+    _default_code = "CONVERSION_FAILED"
 
 
 class FFmpegError(ProcessingError):
     """Raised when FFmpeg subprocess fails."""
+    _default_code = "FFMPEG_ERROR"
+
     def __init__(self, message: str, return_code: int = None, stderr: str = None):
         details = {}
         if return_code is not None:
             details["return_code"] = return_code
         if stderr:
             details["stderr"] = stderr
-        super().__init__(message, details=details)
-        self.code = "FFMPEG_ERROR"
+        super().__init__(message, details=details or None)
 
 
 class TimeoutError(ProcessingError):
     """Raised when processing times out."""
+    _default_code = "TIMEOUT_ERROR"
+
     def __init__(self, message: str = "Operation timed out", limit_seconds: int = None):
-        details = {}
-        if limit_seconds:
-            details["limit_seconds"] = limit_seconds
+        details = {"limit_seconds": limit_seconds} if limit_seconds else None
         super().__init__(message, details=details)
-        self.code = "TIMEOUT_ERROR"
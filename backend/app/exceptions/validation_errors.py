@@ -4,32 +4,32 @@ from .base import HarmonixError
 
 class ValidationError(HarmonixError):
     """Base class for validation errors."""
+    _default_code = "VALIDATION_ERROR"
+
     def __init__(self, message: str, details: dict = None):
-        super().__init__(message, code="VALIDATION_ERROR", details=details)
+        super().__init__(message, details=details)
 
 
 class AudioValidationError(ValidationError):
     """Raised when audio file validation fails."""
-    def __init__(self, message: str, details: dict = None):
-        super().__init__(message, details=details)
-        self.code = "INVALID_AUDIO_FILE"
+    _default_code = "INVALID_AUDIO_FILE"
 
 
 class ParameterError(ValidationError):
     """Raised when processing parameters are invalid."""
+    _default_code = "INVALID_PARAMETER"
+
     def __init__(self, message: str, param_name: str = None, details: dict = None):
-        details = details or {}
         if param_name:
-            details["parameter"] = param_name
+            details = {**details, "parameter": param_name} if details else {"parameter": param_name}
         super().__init__(message, details=details)
-        self.code = "INVALID_PARAMETER"
 
 
 class FormatError(ValidationError):
     """Raised when format specifications are invalid."""
+    _default_code = "INVALID_FORMAT"
+
     def __init__(self, message: str, format_name: str = None, details: dict = None):
-        details = details or {}
         if format_name:
-            details["format"] = format_name
+            details = {**details, "format": format_name} if details else {"format": format_name}
         super().__init__(message, details=details)
-        self.code = "INVALID_FORMAT"
@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from pydub import AudioSegment as AudioSegmentType
 
-# Import handling for optional pydub dependency
-try:
-    from pydub import AudioSegment  # type: ignore
-    from pydub.utils import which as _find_executable  # type: ignore
-except ModuleNotFoundError as exc:
-    AudioSegment = None  # type: ignore[assignment]
-    _find_executable = None
-    _IMPORT_ERROR = exc
-else:
-    _find_executable = _find_executable
-    _IMPORT_ERROR = None
+
+@lru_cache(maxsize=1)
+def _load_pydub() -> Tuple[
+    Any, Optional[Callable[[str], Optional[str]]], Optional[ModuleNotFoundError]
+]:
+    """Import the optional pydub dependency on first use.
+
+    Kept out of module import so FFmpeg-only paths (conversion, probing)
+    never load pydub. Returns ``(AudioSegment, which, import_error)``.
+    """
+    try:
+        from pydub import AudioSegment  # type: ignore
+        from pydub.utils import which  # type: ignore
+    except ModuleNotFoundError as exc:
+        return None, None, exc
+    return AudioSegment, which, None
 
 
 # ----------------------------------------------------------------------
@@ -73,6 +81,7 @@ class NoOutputProducedError(AudioProcessingError):
 
 def resolve_environment() -> None:
     """Verify that pydub and FFmpeg are available."""
+    AudioSegment, _find_executable, _ = _load_pydub()
     if AudioSegment is None:
         raise MissingDependencyError("pydub")
 
@@ -107,6 +116,47 @@ def resolve_environment() -> None:
         raise MissingEncoderError()
 
 
+# ----------------------------------------------------------------------
+# Subprocess Helpers
+# ----------------------------------------------------------------------
+
+def hidden_window_kwargs() -> Dict[str, Any]:
+    """Return ``subprocess`` keyword arguments that hide the console window.
+
+    On Windows every FFmpeg/ffprobe call would otherwise flash a console;
+    elsewhere no extra arguments are needed.
+    """
+    if os.name != "nt":
+        return {}
+
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return {
+        "startupinfo": startupinfo,
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+    }
+
+
+def threads_per_process(worker_count: int) -> int:
+    """Split the CPU count across ``worker_count`` concurrent FFmpeg processes.
+
+    Without a ``-threads`` cap every FFmpeg spawns one thread per core, so
+    parallel batches oversubscribe the CPU quadratically.
+    """
+    return max(1, (os.cpu_count() or 1) // max(1, worker_count))
+
+
+def name_key(name: str) -> str:
+    """Key for comparing file names as case-insensitive filesystems do.
+
+    Windows and macOS (the shipping targets) treat ``Song.MP3`` and
+    ``song.mp3`` as the same file; on case-sensitive systems this only
+    makes collision checks conservative.
+    """
+    return os.path.normcase(name).casefold()
+
+
 # ----------------------------------------------------------------------
 # Error Formatting
 # ----------------------------------------------------------------------
@@ -176,7 +226,8 @@ def validate_input_paths(input_paths: list[Path]) -> None:
 
 def validate_pydub_available() -> None:
     """Validate that pydub is available."""
+    AudioSegment, _, import_error = _load_pydub()
     if AudioSegment is None:
-        assert _IMPORT_ERROR is not None
-        missing_package = _IMPORT_ERROR.name or "pydub"
+        assert import_error is not None
+        missing_package = import_error.name or "pydub"
         raise MissingDependencyError(missing_package)
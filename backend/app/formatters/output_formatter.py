@@ -4,10 +4,85 @@ This module standardizes the structure of JSON messages sent to stdout
 for the Tauri frontend to consume.
 """
 
+import sys
+import time
 from typing import Any, Dict, Optional, Union
-import json
 from datetime import datetime
 
+# Bound once at import so each response avoids the attribute lookup chain
+_utcnow = datetime.utcnow
+_ISO_SUFFIX = "Z"
+
+# Timestamps produced within this window are reused (50ms)
+_TIMESTAMP_TTL_NS = 50_000_000
+_last_ts_ns = 0
+_last_ts_str = ""
+
+
+def _iso_now(ttl_ns: int = _TIMESTAMP_TTL_NS) -> str:
+    """Return the current UTC time as an ISO 8601 string.
+
+    Bursts of responses (e.g. progress ticks) within ``ttl_ns`` of each
+    other share a single formatted timestamp.
+
+    Args:
+        ttl_ns: Maximum age in nanoseconds of a reused timestamp.
+
+    Returns:
+        ISO 8601 timestamp with a trailing 'Z'.
+    """
+    global _last_ts_ns, _last_ts_str
+    now = time.monotonic_ns()
+    if not _last_ts_str or now - _last_ts_ns > ttl_ns:
+        _last_ts_str = _utcnow().isoformat() + _ISO_SUFFIX
+        _last_ts_ns = now
+    return _last_ts_str
+
+
+# Interned status values shared by every response
+_STATUS_SUCCESS = sys.intern("success")
+_STATUS_ERROR = sys.intern("error")
+_STATUS_PROGRESS = sys.intern("progress")
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values; anything else (e.g. bad JSON input) passes through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Fixed-layout response templates; each call copies one and fills it in
+_SUCCESS_TEMPLATE: Dict[str, Any] = {
+    "status": _STATUS_SUCCESS,
+    "operation": "",
+    "timestamp": "",
+    "message": "",
+}
+_ERROR_TEMPLATE: Dict[str, Any] = {
+    "status": _STATUS_ERROR,
+    "operation": "",
+    "timestamp": "",
+    "error": None,
+}
+_PROGRESS_TEMPLATE: Dict[str, Any] = {
+    "status": _STATUS_PROGRESS,
+    "operation": "",
+    "timestamp": "",
+    "progress": None,
+}
+_ANALYSIS_TEMPLATE: Dict[str, Any] = dict.fromkeys(
+    ("file", "duration_seconds", "format", "statistics", "analyzed_at")
+)
+
+
+def _round_percent(percent: float) -> float:
+    """Round a percentage to two decimals (half away from zero).
+
+    Integer arithmetic avoids the slower ``round(x, 2)`` float path.
+    """
+    if percent >= 0:
+        return int(percent * 100.0 + 0.5) / 100.0
+    return -int(-percent * 100.0 + 0.5) / 100.0
+
 
 def format_success(
     operation: str,
@@ -24,12 +99,10 @@ def format_success(
     Returns:
         Dict representing the standard success response structure.
     """
-    response = {
-        "status": "success",
-        "operation": operation,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "message": message,
-    }
+    response = _SUCCESS_TEMPLATE.copy()
+    response["operation"] = _intern(operation)
+    response["timestamp"] = _iso_now()
+    response["message"] = message
     
     if data:
         response["data"] = data
@@ -54,14 +127,12 @@ def format_error(
     Returns:
         Dict representing the standard error response structure.
     """
-    response = {
-        "status": "error",
-        "operation": operation,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "error": {
-            "code": error_code,
-            "message": error_message
-        }
+    response = _ERROR_TEMPLATE.copy()
+    response["operation"] = _intern(operation)
+    response["timestamp"] = _iso_now()
+    response["error"] = {
+        "code": error_code,
+        "message": error_message
     }
     
     if details:
@@ -74,7 +145,8 @@ def format_progress(
     operation: str,
     percent: float,
     current_file: Optional[str] = None,
-    stage: str = "processing"
+    stage: str = "processing",
+    timestamp: Optional[str] = None
 ) -> Dict[str, Any]:
     """Format a progress update.
 
@@ -83,20 +155,20 @@ def format_progress(
         percent: Progress percentage (0.0 to 100.0).
         current_file: Name of the file currently being processed.
         stage: Current processing stage description.
+        timestamp: Optional precomputed ISO timestamp to reuse across a burst.
 
     Returns:
         Dict representing the progress update structure.
     """
-    return {
-        "status": "progress",
-        "operation": operation,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "progress": {
-            "percent": round(percent, 2),
-            "stage": stage,
-            "file": current_file
-        }
+    response = _PROGRESS_TEMPLATE.copy()
+    response["operation"] = _intern(operation)
+    response["timestamp"] = timestamp or _iso_now()
+    response["progress"] = {
+        "percent": _round_percent(percent),
+        "stage": _intern(stage),
+        "file": current_file
     }
+    return response
 
 
 def format_analysis_result(
@@ -116,10 +188,10 @@ def format_analysis_result(
     Returns:
         Dict representing the analysis result data block.
     """
-    return {
-        "file": file_path,
-        "duration_seconds": duration,
-        "format": format_info,
-        "statistics": audio_stats,
-        "analyzed_at": datetime.utcnow().isoformat() + "Z"
-    }
+    response = _ANALYSIS_TEMPLATE.copy()
+    response["file"] = file_path
+    response["duration_seconds"] = duration
+    response["format"] = format_info
+    response["statistics"] = audio_stats
+    response["analyzed_at"] = _iso_now()
+    return response
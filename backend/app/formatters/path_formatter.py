@@ -6,9 +6,20 @@ output path generation logic.
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Windows invalid: < > : " / \ | ? *
+# Unix: /
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Translation table that deletes null bytes
+_NULL_BYTE_TABLE = str.maketrans('', '', '\0')
+
+# Every character that forces the slow path (invalid characters + null byte)
+_INVALID_CHAR_SET = frozenset('<>:"/\\|?*\0')
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename by removing invalid characters.
@@ -19,13 +30,13 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for file systems.
     """
-    # Remove null bytes
-    filename = filename.replace('\0', '')
-    
-    # Replace invalid characters with underscore
-    # Windows invalid: < > : " / \ | ? *
-    # Unix: /
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    # Fast path: clean names only need the strip below
+    if not _INVALID_CHAR_SET.isdisjoint(filename):
+        # Remove null bytes
+        filename = filename.translate(_NULL_BYTE_TABLE)
+
+        # Replace invalid characters with underscore
+        filename = _INVALID_CHARS_RE.sub('_', filename)
     
     # Remove leading/trailing periods and spaces
     filename = filename.strip('. ')
@@ -42,28 +53,59 @@ def ensure_unique_path(base_path: Path) -> Path:
 
     Example: file.mp3 -> file_1.mp3 -> file_2.mp3
 
+    The parent directory is listed once to skip names that are already
+    taken, then the chosen name is claimed atomically with
+    ``O_CREAT | O_EXCL`` so concurrent workers never receive the same path.
+    A missing parent directory is created first. The claimed path exists
+    as an empty file when this function returns; callers that end up not
+    writing it should remove it.
+
     Args:
         base_path: Desired path.
 
     Returns:
         Unique Path object.
     """
-    if not base_path.exists():
-        return base_path
+    parent = base_path.parent
+    parent.mkdir(parents=True, exist_ok=True)
+    with os.scandir(parent) as entries:
+        existing = {entry.name for entry in entries}
 
     stem = base_path.stem
     suffix = base_path.suffix
-    parent = base_path.parent
-    counter = 1
+    counter = 0
 
     while True:
-        new_name = f"{stem}_{counter}{suffix}"
-        new_path = parent / new_name
-        if not new_path.exists():
-            return new_path
+        name = base_path.name if counter == 0 else f"{stem}_{counter}{suffix}"
+        if name not in existing:
+            candidate = parent / name
+            try:
+                fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                # Claimed by someone else since the directory listing
+                pass
+            else:
+                os.close(fd)
+                return candidate
         counter += 1
 
 
+@lru_cache(maxsize=1024)
+def _sanitized_name(filename: str) -> str:
+    """Memoized :func:`sanitize_filename` for repeated batch names."""
+    return sanitize_filename(filename)
+
+
+@lru_cache(maxsize=32)
+def _resolved_output_dir(output_dir: str) -> str:
+    """Memoized absolute form of an output directory.
+
+    The backend never changes its working directory, so relative
+    directories resolve the same way for the lifetime of the process.
+    """
+    return os.path.abspath(output_dir)
+
+
 def generate_output_path(
     input_path: str,
     output_dir: str,
@@ -72,6 +114,9 @@ def generate_output_path(
 ) -> str:
     """Generate a full output path based on input and settings.
 
+    The path is reserved through :func:`ensure_unique_path`, so it exists
+    as an empty file (with its directory) when this function returns.
+
     Args:
         input_path: Path to the source file.
         output_dir: Directory to save the output.
@@ -81,20 +126,21 @@ def generate_output_path(
     Returns:
         String representation of the absolute output path.
     """
-    input_p = Path(input_path)
-    output_d = Path(output_dir)
+    # Work on plain strings; only the uniqueness check needs a Path
+    stem, input_ext = os.path.splitext(os.path.basename(os.fspath(input_path)))
+    output_d = _resolved_output_dir(os.fspath(output_dir))
     
     # Determine extension
-    ext = f".{output_format.lstrip('.')}" if output_format else input_p.suffix
+    ext = f".{output_format.lstrip('.')}" if output_format else input_ext
     
     # Construct filename
-    new_filename = f"{input_p.stem}{suffix}{ext}"
-    sanitized_name = sanitize_filename(new_filename)
+    new_filename = f"{stem}{suffix}{ext}"
+    sanitized_name = _sanitized_name(new_filename)
     
     # Combine
-    full_path = output_d / sanitized_name
+    full_path = os.path.join(output_d, sanitized_name)
     
     # Ensure uniqueness
-    unique_path = ensure_unique_path(full_path)
+    unique_path = ensure_unique_path(Path(full_path))
     
-    return str(unique_path.absolute())
+    return str(unique_path)
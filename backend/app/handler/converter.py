@@ -6,24 +6,35 @@ FFmpeg execution, and progress reporting.
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import os
 import subprocess
-from dataclasses import dataclass
+import sys
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Sequence, Tuple, Set, Dict, Any, Union
+from shutil import which
+from types import MappingProxyType
+from typing import IO, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple, Set, Dict, Any, Union
 
 from ..ffmpeg_runner import (
-    AudioSegment,
     AudioProcessingError,
     ExportFailureError,
     MissingEncoderError,
     NoOutputProducedError,
     format_error_message,
-    resolve_environment,
+    hidden_window_kwargs,
+    name_key,
+    threads_per_process,
     validate_input_paths,
-    validate_pydub_available,
 )
 
+# Paths cross into subprocess argv as strings; accept either form
+StrPath = Union[str, "os.PathLike[str]"]
+
 
 @dataclass(frozen=True)
 class ConversionRequest:
@@ -35,6 +46,14 @@ class ConversionRequest:
         output_format: Target audio format extension (e.g., 'mp3', 'wav').
         overwrite_existing: Whether to overwrite files if they already exist.
         ffmpeg_path: Optional explicit path to FFmpeg binary.
+        max_workers: Maximum number of FFmpeg processes to run at once.
+            Defaults to the CPU count.
+        files_per_process: Number of files each FFmpeg invocation handles.
+            Values above 1 amortize FFmpeg startup across several files,
+            at the cost of coarser progress updates. 0 spreads the batch
+            evenly over the workers (capped per process).
+        threads_per_process: FFmpeg ``-threads`` value for each process.
+            Defaults to the CPU count divided by the number of workers.
     """
 
     input_paths: Sequence[Path]
@@ -42,6 +61,9 @@ class ConversionRequest:
     output_format: str
     overwrite_existing: bool = True
     ffmpeg_path: Optional[Path] = None
+    max_workers: Optional[int] = None
+    files_per_process: int = 1
+    threads_per_process: Optional[int] = None
 
     def outputs(self) -> Iterable[Tuple[Path, Path]]:
         """Yield tuples of ``(input_path, output_path)`` for the batch.
@@ -52,24 +74,28 @@ class ConversionRequest:
         Yields:
             Tuple containing (source_path, destination_path).
         """
-        allocated: Set[Path] = set()
+        # One directory listing up front; conflicts are resolved in memory
+        taken: Set[str] = set()
+        if not self.overwrite_existing:
+            try:
+                taken = {name_key(name) for name in os.listdir(self.output_directory)}
+            except (FileNotFoundError, NotADirectoryError):
+                pass
 
+        suffix = f".{self.output_format}"
         for source in self.input_paths:
-            base_destination = self.output_directory / f"{source.stem}.{self.output_format}"
-            destination = base_destination
+            stem = source.stem
+            name = f"{stem}{suffix}"
 
             if not self.overwrite_existing:
-                candidate = base_destination
+                # Candidates are plain strings; a Path is built only once
                 index = 1
-                while candidate.exists() or candidate in allocated:
-                    candidate = base_destination.with_stem(
-                        f"{base_destination.stem} ({index})"
-                    )
+                while name_key(name) in taken:
+                    name = f"{stem} ({index}){suffix}"
                     index += 1
-                destination = candidate
+                taken.add(name_key(name))
 
-            allocated.add(destination)
-            yield source, destination
+            yield source, self.output_directory / name
 
 
 @dataclass(frozen=True)
@@ -97,6 +123,8 @@ class ConversionProgress:
         total: Total number of files in the batch.
         source: Path to the source file.
         destination: Path to the destination file.
+        position: Seconds of audio encoded so far, set on ``encoding``
+            updates while FFmpeg runs.
     """
 
     status: str
@@ -104,6 +132,7 @@ class ConversionProgress:
     total: int
     source: Path
     destination: Path
+    position: Optional[float] = None
 
 
 class SoundConverter:
@@ -136,13 +165,11 @@ class SoundConverter:
         Returns:
             ConversionResult object indicating success or failure.
         """
+        request = _with_sized_inputs(request)
         try:
             validate_input_paths(list(request.input_paths))
-            # Note: We don't strictly need pydub for direct ffmpeg conversion, 
-            # but we keep the check if other parts rely on it.
-            # validate_pydub_available() 
-            resolve_environment()
-            
+            # Conversion shells out to FFmpeg directly; pydub is not needed.
+            # A missing FFmpeg surfaces as MissingEncoderError from the batch.
             outputs = SoundConverter._export_batch(
                 request, progress_callback, log_callback
             )
@@ -157,6 +184,51 @@ class SoundConverter:
         message = SoundConverter._format_success_message(request, outputs)
         return ConversionResult(True, message, outputs)
 
+    @staticmethod
+    def convert_from_stream(
+        producer_command: Sequence[str],
+        request: ConversionRequest,
+        log_callback: Optional[Callable[[str], None]] = None,
+    ) -> ConversionResult:
+        """Encode the WAV stream written by another FFmpeg process.
+
+        The producer (e.g. a modifier command targeting ``pipe:1``) runs
+        concurrently with the encoder and its stdout is wired straight into
+        the encoder's stdin, so no intermediate file touches the disk.
+
+        Args:
+            producer_command: FFmpeg command writing WAV to stdout.
+            request: Conversion request; its first input names the output.
+            log_callback: Optional callback invoked with stderr lines of
+                both processes.
+
+        Returns:
+            ConversionResult object indicating success or failure.
+        """
+        request = _with_sized_inputs(request)
+        try:
+            validate_input_paths(list(request.input_paths))
+            converter = _resolve_converter_path(request)
+            request.output_directory.mkdir(parents=True, exist_ok=True)
+            source, destination = next(iter(request.outputs()))
+            try:
+                _run_ffmpeg_stream(
+                    converter,
+                    producer_command,
+                    destination,
+                    request.output_format.lower(),
+                    log_callback,
+                )
+            except Exception as exc:
+                raise ExportFailureError(source, exc, 1)
+        except AudioProcessingError as error:
+            message = format_error_message(error)
+            return ConversionResult(False, message, ())
+
+        outputs = (destination,)
+        message = SoundConverter._format_success_message(request, outputs)
+        return ConversionResult(True, message, outputs)
+
     @staticmethod
     def _export_batch(
         request: ConversionRequest,
@@ -165,73 +237,242 @@ class SoundConverter:
     ) -> Tuple[Path, ...]:
         """Export all files in the batch.
         
+        Files are converted concurrently on a bounded thread pool; each worker
+        only waits on its own FFmpeg subprocess. Callbacks are serialized so
+        progress and log lines never interleave.
+        
         Args:
             request: The conversion request.
             progress_callback: Callback for progress updates.
             log_callback: Callback for logging.
             
         Returns:
-            Tuple of successfully converted file paths.
+            Tuple of successfully converted file paths, in input order.
         """
-        converted = []
+        # Converted to str once; every FFmpeg command reuses it
+        converter = os.fspath(_resolve_converter_path(request))
         request.output_directory.mkdir(parents=True, exist_ok=True)
+        jobs = [
+            (index, input_path, output_path)
+            for index, (input_path, output_path) in enumerate(request.outputs(), start=1)
+        ]
+        total = len(request.input_paths)
+        output_format = request.output_format.lower()
 
-        for index, (input_path, output_path) in enumerate(request.outputs(), start=1):
+        callback_lock = threading.Lock()
+
+        def report(
+            status: str,
+            index: int,
+            source: Path,
+            destination: Path,
+            position: Optional[float] = None,
+        ) -> None:
             if progress_callback:
-                progress_callback(
-                    ConversionProgress(
-                        status="processing",
-                        index=index,
-                        total=len(request.input_paths),
-                        source=input_path,
-                        destination=output_path,
+                with callback_lock:
+                    progress_callback(
+                        ConversionProgress(
+                            status=status,
+                            index=index,
+                            total=total,
+                            source=source,
+                            destination=destination,
+                            position=position,
+                        )
                     )
-                )
 
-            try:
-                converter = _resolve_converter_path(request)
-                
-                # Check for in-place conversion (input == output)
-                # FFmpeg cannot read/write same file, so we write to temp file first
-                use_temp_file = input_path.resolve() == output_path.resolve()
-                actual_output_path = output_path
-                
-                if use_temp_file:
-                    actual_output_path = output_path.with_suffix(f".tmp{output_path.suffix}")
-                    if log_callback:
-                        log_callback(f"In-place conversion detected. Using temp file: {actual_output_path}")
+        def log(line: str) -> None:
+            with callback_lock:
+                log_callback(line)
+
+        worker_log = log if log_callback else None
 
-                _run_ffmpeg_conversion(
+        def convert_one(index: int, input_path: Path, output_path: Path) -> None:
+            position_callback = None
+            if progress_callback:
+                def position_callback(seconds: float) -> None:
+                    report("encoding", index, input_path, output_path, seconds)
+            try:
+                _convert_file(
                     converter,
                     input_path,
-                    actual_output_path,
-                    request.output_format.lower(),
-                    log_callback,
+                    output_path,
+                    output_format,
+                    worker_log,
+                    threads,
+                    position_callback,
                 )
-                
-                # If using temp file, move it to final destination after success
-                if use_temp_file:
-                    import shutil
-                    shutil.move(str(actual_output_path), str(output_path))
-                    if log_callback:
-                        log_callback(f"Renamed temp file to: {output_path}")
             except Exception as exc:
-                raise ExportFailureError(input_path, exc, len(request.input_paths))
+                raise ExportFailureError(input_path, exc, total)
+
+        def convert_group(group: List[Tuple[int, Path, Path]]) -> List[Path]:
+            for index, input_path, output_path in group:
+                report("processing", index, input_path, output_path)
+
+            if len(group) == 1:
+                convert_one(*group[0])
+            else:
+                try:
+                    _run_ffmpeg_batch(
+                        converter,
+                        [
+                            (os.fspath(input_path), os.fspath(output_path))
+                            for _, input_path, output_path in group
+                        ],
+                        output_format,
+                        worker_log,
+                        threads,
+                    )
+                except Exception as exc:
+                    # Retry one by one so a failure is attributed to its file
+                    if worker_log:
+                        worker_log(f"Grouped conversion failed ({exc}); retrying files individually")
+                    for job in group:
+                        convert_one(*job)
+
+            for index, input_path, output_path in group:
+                report("completed", index, input_path, output_path)
+            return [output_path for _, _, output_path in group]
+
+        max_workers = request.max_workers or os.cpu_count() or 1
+        files_per_process = request.files_per_process
+        if files_per_process == 0:
+            files_per_process = _auto_files_per_process(len(jobs), max_workers)
+        groups = _group_jobs(jobs, files_per_process)
+        max_workers = max(1, min(max_workers, len(groups)))
+        threads = request.threads_per_process or threads_per_process(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(convert_group, group) for group in groups]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            # Surface the first failure in input order
+            for future in futures:
+                if future in done and future.exception() is not None:
+                    raise future.exception()
+
+        return tuple(path for future in futures for path in future.result())
+
+    @staticmethod
+    async def convert_async(
+        request: ConversionRequest,
+        progress_callback: Optional[Callable[[ConversionProgress], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+    ) -> ConversionResult:
+        """Asyncio variant of :meth:`convert`.
+
+        A single event loop drives up to ``request.max_workers`` FFmpeg
+        processes, so no thread is parked per file. Callbacks run on the
+        event loop thread. Use ``asyncio.run(SoundConverter.convert_async(...))``
+        from synchronous code.
+
+        Args:
+            request: Conversion request payload.
+            progress_callback: Optional callback invoked with :class:`ConversionProgress` updates.
+            log_callback: Optional callback invoked with FFmpeg stderr lines.
+
+        Returns:
+            ConversionResult object indicating success or failure.
+        """
+        request = _with_sized_inputs(request)
+        try:
+            validate_input_paths(list(request.input_paths))
+            outputs = await SoundConverter._export_batch_async(
+                request, progress_callback, log_callback
+            )
+
+            if not outputs:
+                raise NoOutputProducedError()
+
+        except AudioProcessingError as error:
+            message = format_error_message(error)
+            return ConversionResult(False, message, ())
 
-            converted.append(output_path)
+        message = SoundConverter._format_success_message(request, outputs)
+        return ConversionResult(True, message, outputs)
 
+    @staticmethod
+    async def _export_batch_async(
+        request: ConversionRequest,
+        progress_callback: Optional[Callable[[ConversionProgress], None]],
+        log_callback: Optional[Callable[[str], None]],
+    ) -> Tuple[Path, ...]:
+        """Export all files concurrently, bounded by an asyncio semaphore.
+        
+        Returns:
+            Tuple of successfully converted file paths, in input order.
+        """
+        converter = os.fspath(_resolve_converter_path(request))
+        request.output_directory.mkdir(parents=True, exist_ok=True)
+        jobs = list(enumerate(request.outputs(), start=1))
+        total = len(request.input_paths)
+        output_format = request.output_format.lower()
+
+        max_concurrent = request.max_workers or os.cpu_count() or 1
+        max_concurrent = max(1, min(max_concurrent, len(jobs)))
+        threads = request.threads_per_process or threads_per_process(max_concurrent)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        def report(
+            status: str,
+            index: int,
+            source: Path,
+            destination: Path,
+            position: Optional[float] = None,
+        ) -> None:
             if progress_callback:
                 progress_callback(
                     ConversionProgress(
-                        status="completed",
+                        status=status,
                         index=index,
-                        total=len(request.input_paths),
-                        source=input_path,
-                        destination=output_path,
+                        total=total,
+                        source=source,
+                        destination=destination,
+                        position=position,
                     )
                 )
 
-        return tuple(converted)
+        async def convert_one(index: int, input_path: Path, output_path: Path) -> Path:
+            position_callback = None
+            if progress_callback:
+                def position_callback(seconds: float) -> None:
+                    report("encoding", index, input_path, output_path, seconds)
+
+            async with semaphore:
+                report("processing", index, input_path, output_path)
+                try:
+                    await _convert_file_async(
+                        converter,
+                        input_path,
+                        output_path,
+                        output_format,
+                        log_callback,
+                        threads,
+                        position_callback,
+                    )
+                except Exception as exc:
+                    raise ExportFailureError(input_path, exc, total)
+                report("completed", index, input_path, output_path)
+            return output_path
+
+        tasks = [
+            asyncio.ensure_future(convert_one(index, input_path, output_path))
+            for index, (input_path, output_path) in jobs
+        ]
+        try:
+            return tuple(await asyncio.gather(*tasks))
+        except BaseException as error:
+            # Stop the rest of the batch; cancelled runners kill their FFmpeg
+            for task in tasks:
+                task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if isinstance(error, Exception):
+                # Surface the first failure in input order
+                for result in results:
+                    if isinstance(result, Exception):
+                        raise result
+            raise
 
     @staticmethod
     def _format_success_message(request: ConversionRequest, outputs: Tuple[Path, ...]) -> str:
@@ -244,94 +485,523 @@ class SoundConverter:
         return f"Converted {len(outputs)} files into {destination_text}"
 
 
-def _run_ffmpeg_conversion(
-    converter: Path,
+def _with_sized_inputs(request: ConversionRequest) -> ConversionRequest:
+    """Materialize lazy ``input_paths`` once so the batch can size and re-iterate it."""
+    if hasattr(request.input_paths, "__len__"):
+        return request
+    return replace(request, input_paths=tuple(request.input_paths))
+
+
+def _convert_file(
+    converter: StrPath,
     input_path: Path,
     output_path: Path,
     output_format: str,
     log_callback: Optional[Callable[[str], None]],
+    threads: Optional[int] = None,
+    progress_callback: Optional[Callable[[float], None]] = None,
 ) -> None:
-    """Run FFmpeg conversion with explicit format and codec specification.
+    """Convert a single file, using a temp file for in-place conversions.
     
     Args:
         converter: Path to FFmpeg executable.
         input_path: Source file path.
         output_path: Destination file path.
-        output_format: Target format string.
+        output_format: Target format string (lowercase).
         log_callback: Callback for stderr logging.
-        
-    Raises:
-        RuntimeError: If FFmpeg exits with non-zero code.
+        threads: Optional FFmpeg ``-threads`` value.
+        progress_callback: Optional callback invoked with the encoded
+            position in seconds.
     """
+    actual_output_path = _staging_path(input_path, output_path, log_callback)
+    use_temp_file = actual_output_path != output_path
+
+    _run_ffmpeg_conversion(
+        converter,
+        os.fspath(input_path),
+        os.fspath(actual_output_path),
+        output_format,
+        log_callback,
+        progress_callback,
+        threads=threads,
+    )
     
-    # Map output format to FFmpeg codec and format
-    # This ensures proper encoding instead of relying on extension guessing
-    format_codec_map: Dict[str, Dict[str, str]] = {
-        "mp3": {"format": "mp3", "codec": "libmp3lame", "bitrate": "192k"},
-        "aac": {"format": "adts", "codec": "aac", "bitrate": "192k"},
-        "m4a": {"format": "ipod", "codec": "aac", "bitrate": "192k"},
-        "wav": {"format": "wav", "codec": "pcm_s16le"},
-        "flac": {"format": "flac", "codec": "flac"},
-        "ogg": {"format": "ogg", "codec": "libvorbis", "bitrate": "192k"},
-        "opus": {"format": "opus", "codec": "libopus", "bitrate": "128k"},
-        "wma": {"format": "asf", "codec": "wmav2", "bitrate": "192k"},
-        "aiff": {"format": "aiff", "codec": "pcm_s16be"},
-    }
+    # If using temp file, move it to final destination after success.
+    # The temp file sits next to the destination, so this is an atomic
+    # same-filesystem rename rather than a copy.
+    if use_temp_file:
+        os.replace(actual_output_path, output_path)
+        if log_callback:
+            log_callback(f"Renamed temp file to: {output_path}")
+
+
+async def _convert_file_async(
+    converter: StrPath,
+    input_path: Path,
+    output_path: Path,
+    output_format: str,
+    log_callback: Optional[Callable[[str], None]],
+    threads: Optional[int] = None,
+    progress_callback: Optional[Callable[[float], None]] = None,
+) -> None:
+    """Asyncio counterpart of :func:`_convert_file`."""
+    actual_output_path = _staging_path(input_path, output_path, log_callback)
+
+    await _run_ffmpeg_async(
+        _conversion_command(
+            converter, input_path, actual_output_path, output_format, threads
+        ),
+        log_callback,
+        progress_callback,
+    )
+
+    if actual_output_path != output_path:
+        os.replace(actual_output_path, output_path)
+        if log_callback:
+            log_callback(f"Renamed temp file to: {output_path}")
+
+
+def _staging_path(
+    input_path: Path,
+    output_path: Path,
+    log_callback: Optional[Callable[[str], None]],
+) -> Path:
+    """Return where FFmpeg should write ``output_path``.
     
-    format_lower = output_format.lower()
-    codec_config = format_codec_map.get(format_lower, {})
+    FFmpeg cannot read and write the same file, so in-place conversions
+    are written to a temp file next to the destination first.
+    """
+    if input_path.resolve() != output_path.resolve():
+        return output_path
+
+    temp_path = output_path.with_suffix(f".tmp{output_path.suffix}")
+    if log_callback:
+        log_callback(f"In-place conversion detected. Using temp file: {temp_path}")
+    return temp_path
+
+
+# Upper bound on inputs one FFmpeg invocation keeps open at once
+_MAX_FILES_PER_PROCESS = 32
+
+
+def _auto_files_per_process(job_count: int, max_workers: int) -> int:
+    """Spread ``job_count`` files evenly over ``max_workers`` FFmpeg processes."""
+    per_worker = -(-job_count // max(1, max_workers))
+    return max(1, min(per_worker, _MAX_FILES_PER_PROCESS))
+
+
+def _group_jobs(
+    jobs: List[Tuple[int, Path, Path]],
+    files_per_process: int,
+) -> List[List[Tuple[int, Path, Path]]]:
+    """Split jobs into groups that share one FFmpeg invocation.
     
-    # Build FFmpeg command with explicit codec and format
-    command = [
-        str(converter),
-        "-y",  # Overwrite output
-        "-i", str(input_path),
-    ]
+    In-place conversions need a temp file and rename, so they always run
+    in a group of their own.
+    """
+    size = max(1, files_per_process)
+    groups: List[List[Tuple[int, Path, Path]]] = []
+    current: List[Tuple[int, Path, Path]] = []
+
+    for job in jobs:
+        _, input_path, output_path = job
+        if size > 1 and input_path.resolve() == output_path.resolve():
+            groups.append([job])
+            continue
+        current.append(job)
+        if len(current) == size:
+            groups.append(current)
+            current = []
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+# GPU encoder alternatives, used only when HARMONIX_HWACCEL is set and the
+# FFmpeg build ships NVENC. NVENC/NVDEC are video-only, so every audio format
+# stays on its software encoder; video targets add entries here
+# (e.g. "mp4": "h264_nvenc").
+_HW_CODECS: Dict[str, str] = {}
+
+
+@lru_cache(maxsize=4)
+def _hw_accel_available(converter: StrPath) -> bool:
+    """Check once per binary whether FFmpeg was built with NVENC encoders."""
+    try:
+        result = subprocess.run(
+            [os.fspath(converter), "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            **hidden_window_kwargs(),
+        )
+    except OSError:
+        return False
+    return "h264_nvenc" in result.stdout
+
+
+def _hw_codec_for(converter: StrPath, output_format: str) -> Optional[str]:
+    """Return the GPU encoder to use for ``output_format``, if any."""
+    if not os.environ.get("HARMONIX_HWACCEL"):
+        return None
+    hw_codec = _HW_CODECS.get(output_format.lower())
+    if hw_codec is None or not _hw_accel_available(converter):
+        return None
+    return hw_codec
+
+
+# Map output format to FFmpeg codec and format
+# This ensures proper encoding instead of relying on extension guessing
+_FORMAT_CODEC_MAP: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "mp3": MappingProxyType({"format": "mp3", "codec": "libmp3lame", "bitrate": "192k"}),
+    "aac": MappingProxyType({"format": "adts", "codec": "aac", "bitrate": "192k"}),
+    "m4a": MappingProxyType({"format": "ipod", "codec": "aac", "bitrate": "192k"}),
+    "wav": MappingProxyType({"format": "wav", "codec": "pcm_s16le"}),
+    "flac": MappingProxyType({"format": "flac", "codec": "flac"}),
+    "ogg": MappingProxyType({"format": "ogg", "codec": "libvorbis", "bitrate": "192k"}),
+    "opus": MappingProxyType({"format": "opus", "codec": "libopus", "bitrate": "128k"}),
+    "wma": MappingProxyType({"format": "asf", "codec": "wmav2", "bitrate": "192k"}),
+    "aiff": MappingProxyType({"format": "aiff", "codec": "pcm_s16be"}),
+})
+_EMPTY_MAP: Mapping[str, str] = MappingProxyType({})
+
+
+def _codec_arguments(output_format: str) -> List[str]:
+    """Return the explicit codec/bitrate/container arguments for a format."""
+    codec_config = _FORMAT_CODEC_MAP.get(output_format.lower(), _EMPTY_MAP)
+    arguments: List[str] = []
     
     # Add codec specification
     if "codec" in codec_config:
-        command.extend(["-c:a", codec_config["codec"]])
+        arguments.extend(["-c:a", codec_config["codec"]])
     
     # Add bitrate for lossy formats
     if "bitrate" in codec_config:
-        command.extend(["-b:a", codec_config["bitrate"]])
+        arguments.extend(["-b:a", codec_config["bitrate"]])
     
     # Add format specification
     if "format" in codec_config:
-        command.extend(["-f", codec_config["format"]])
+        arguments.extend(["-f", codec_config["format"]])
+
+    return arguments
+
+
+def _run_ffmpeg_conversion(
+    converter: StrPath,
+    input_path: StrPath,
+    output_path: StrPath,
+    output_format: str,
+    log_callback: Optional[Callable[[str], None]],
+    progress_callback: Optional[Callable[[float], None]] = None,
+    threads: Optional[int] = None,
+) -> None:
+    """Run FFmpeg conversion with explicit format and codec specification.
+    
+    Args:
+        converter: Path to FFmpeg executable.
+        input_path: Source file path.
+        output_path: Destination file path.
+        output_format: Target format string.
+        log_callback: Callback for stderr logging.
+        progress_callback: Optional callback invoked with the encoded
+            position in seconds.
+        threads: Optional FFmpeg ``-threads`` value.
+        
+    Raises:
+        RuntimeError: If FFmpeg exits with non-zero code.
+    """
+    _run_ffmpeg(
+        _conversion_command(converter, input_path, output_path, output_format, threads),
+        log_callback,
+        progress_callback,
+    )
+
+
+def _conversion_command(
+    converter: StrPath,
+    input_path: StrPath,
+    output_path: StrPath,
+    output_format: str,
+    threads: Optional[int] = None,
+) -> List[str]:
+    """Build the single-file FFmpeg command shared by the sync and async runners."""
+    hw_codec = _hw_codec_for(converter, output_format)
+
+    # Build FFmpeg command with explicit codec and format
+    command = [
+        os.fspath(converter),
+        "-y",  # Overwrite output
+    ]
+    if threads:
+        command.extend(["-threads", str(threads)])
+    if hw_codec:
+        command.extend(["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"])
+    command.extend(["-i", os.fspath(input_path)])
+    command.extend(_codec_arguments(output_format))
+    if hw_codec:
+        command.extend(["-c:v", hw_codec])
+    command.append(os.fspath(output_path))
+    return command
+
+
+def _run_ffmpeg_batch(
+    converter: StrPath,
+    pairs: Sequence[Tuple[StrPath, StrPath]],
+    output_format: str,
+    log_callback: Optional[Callable[[str], None]],
+    threads: Optional[int] = None,
+) -> None:
+    """Convert several files with a single FFmpeg invocation.
     
-    command.append(str(output_path))
+    Every input is opened with its own ``-i`` and each output explicitly maps
+    the audio stream and metadata of its matching input; FFmpeg's default
+    stream selection would otherwise pick from all inputs.
+    
+    Args:
+        converter: Path to FFmpeg executable.
+        pairs: Sequence of ``(input_path, output_path)`` tuples.
+        output_format: Target format string.
+        log_callback: Callback for stderr logging.
+        threads: Optional FFmpeg ``-threads`` value.
+        
+    Raises:
+        RuntimeError: If FFmpeg exits with non-zero code.
+    """
+    command = [os.fspath(converter), "-y"]
+    if threads:
+        command.extend(["-threads", str(threads)])
+    for input_path, _ in pairs:
+        command.extend(["-i", os.fspath(input_path)])
 
-    # Windows-specific: Hide console window
-    startupinfo = None
-    if os.name == 'nt':
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        startupinfo.wShowWindow = subprocess.SW_HIDE
+    codec_arguments = _codec_arguments(output_format)
+    for input_index, (_, output_path) in enumerate(pairs):
+        command.extend(["-map", f"{input_index}:a:0", "-map_metadata", str(input_index)])
+        command.extend(codec_arguments)
+        command.append(os.fspath(output_path))
 
+    _run_ffmpeg(command, log_callback)
+
+
+# Structured progress goes to stdout; stderr only carries errors
+_PROGRESS_ARGUMENTS = ("-progress", "pipe:1", "-nostats", "-loglevel", "error")
+
+
+# Stderr is read in raw chunks of this size and decoded in bulk
+_STDERR_CHUNK_SIZE = 65536
+
+
+def _forward_stderr(
+    process: subprocess.Popen,
+    log_callback: Optional[Callable[[str], None]],
+) -> Optional[threading.Thread]:
+    """Forward a process's binary stderr to ``log_callback`` on a daemon thread.
+    
+    Output is read in 64 KiB chunks and decoded once per chunk; complete
+    lines are passed to the callback and a trailing partial line is
+    carried over to the next chunk. An incremental decoder carries UTF-8
+    sequences split across chunks, so non-ASCII paths are not mangled.
+    """
+    if not log_callback:
+        return None
+    assert process.stderr is not None
+    stream = process.stderr
+
+    def forward() -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        # read1 returns whatever is buffered instead of waiting for a full chunk
+        for chunk in iter(lambda: stream.read1(_STDERR_CHUNK_SIZE), b""):
+            lines = (pending + decoder.decode(chunk)).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                log_callback(line.rstrip())
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            log_callback(pending.rstrip())
+
+    thread = threading.Thread(target=forward, daemon=True)
+    thread.start()
+    return thread
+
+
+def _handle_progress_line(
+    line: bytes,
+    progress_callback: Optional[Callable[[float], None]],
+) -> bool:
+    """Act on one ``-progress`` line; return True once FFmpeg reports the end."""
+    key, _, value = line.partition(b"=")
+    if key == b"out_time_ms":
+        value = value.strip()
+        if progress_callback and value.isdigit():
+            progress_callback(int(value) / 1_000_000)
+    elif key == b"progress" and value.strip() == b"end":
+        return True
+    return False
+
+
+def _run_ffmpeg(
+    command: List[str],
+    log_callback: Optional[Callable[[str], None]],
+    progress_callback: Optional[Callable[[float], None]] = None,
+    stdin: Optional[IO[bytes]] = None,
+) -> None:
+    """Run an FFmpeg command and consume its ``-progress`` output.
+    
+    FFmpeg writes ``key=value`` progress lines to stdout. Only
+    ``out_time_ms`` (microseconds, despite the name) and ``progress=end``
+    are acted on. Stderr is forwarded to ``log_callback`` from a helper
+    thread, or discarded when no callback is given.
+
+    When ``stdin`` is given (another process's stdout), it is handed to
+    FFmpeg and closed in this process so the writer gets SIGPIPE if FFmpeg
+    exits early.
+    
+    Raises:
+        RuntimeError: If FFmpeg exits with non-zero code.
+    """
+    command = [command[0], *_PROGRESS_ARGUMENTS, *command[1:]]
+
+    # Binary pipes: progress lines are ASCII and stderr is decoded in bulk
     process = subprocess.Popen(
         command,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.PIPE,
-        text=True,
-        startupinfo=startupinfo
+        stdin=stdin,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if log_callback else subprocess.DEVNULL,
+        **hidden_window_kwargs()
     )
+    if stdin is not None:
+        stdin.close()
 
-    assert process.stderr is not None
-    for line in process.stderr:
-        if log_callback:
-            log_callback(line.rstrip())
+    stderr_thread = _forward_stderr(process, log_callback)
+
+    assert process.stdout is not None
+    for line in process.stdout:
+        if _handle_progress_line(line, progress_callback):
+            break
+
+    # Drain anything left after progress=end so FFmpeg never blocks on a full pipe
+    for _ in process.stdout:
+        pass
 
     return_code = process.wait()
+    if stderr_thread is not None:
+        stderr_thread.join()
     if return_code != 0:
         raise RuntimeError(f"ffmpeg exited with code {return_code}")
 
 
+async def _run_ffmpeg_async(
+    command: List[str],
+    log_callback: Optional[Callable[[str], None]],
+    progress_callback: Optional[Callable[[float], None]] = None,
+) -> None:
+    """Asyncio counterpart of :func:`_run_ffmpeg`.
+    
+    Stdout progress and stderr are read through non-blocking stream
+    readers, so one event loop can drive many FFmpeg processes. The process
+    is killed if the awaiting task is cancelled.
+    
+    Raises:
+        RuntimeError: If FFmpeg exits with non-zero code.
+    """
+    command = [command[0], *_PROGRESS_ARGUMENTS, *command[1:]]
+
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE if log_callback else asyncio.subprocess.DEVNULL,
+        **hidden_window_kwargs()
+    )
+
+    async def forward_stderr() -> None:
+        assert process.stderr is not None
+        async for line in process.stderr:
+            log_callback(line.decode(errors="replace").rstrip())
+
+    stderr_task = asyncio.ensure_future(forward_stderr()) if log_callback else None
+
+    try:
+        assert process.stdout is not None
+        async for line in process.stdout:
+            if _handle_progress_line(line, progress_callback):
+                break
+
+        # Drain anything left after progress=end so FFmpeg never blocks on a full pipe
+        async for _ in process.stdout:
+            pass
+
+        return_code = await process.wait()
+        if stderr_task is not None:
+            await stderr_task
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.kill()
+        if stderr_task is not None:
+            stderr_task.cancel()
+        raise
+
+    if return_code != 0:
+        raise RuntimeError(f"ffmpeg exited with code {return_code}")
+
+
+def _run_ffmpeg_stream(
+    converter: StrPath,
+    producer_command: Sequence[str],
+    output_path: Path,
+    output_format: str,
+    log_callback: Optional[Callable[[str], None]],
+) -> None:
+    """Pipe a producer's WAV stdout into an encoding FFmpeg process.
+    
+    Both processes run concurrently; their stderr lines share
+    ``log_callback``.
+    
+    Args:
+        converter: Path to FFmpeg executable for the encoder.
+        producer_command: Command writing WAV (``-f wav pipe:1``) to stdout.
+        output_path: Destination file path.
+        output_format: Target format string (lowercase).
+        log_callback: Callback for stderr logging.
+        
+    Raises:
+        RuntimeError: If either process exits with non-zero code.
+    """
+    # The producer writes raw WAV to its stdout
+    producer = subprocess.Popen(
+        list(producer_command),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if log_callback else subprocess.DEVNULL,
+        **hidden_window_kwargs()
+    )
+    producer_log = _forward_stderr(producer, log_callback)
+
+    command = [os.fspath(converter), "-y", "-f", "wav", "-i", "pipe:0"]
+    command.extend(_codec_arguments(output_format))
+    command.append(os.fspath(output_path))
+
+    try:
+        _run_ffmpeg(command, log_callback, stdin=producer.stdout)
+    except Exception:
+        producer.kill()
+        raise
+    finally:
+        producer_code = producer.wait()
+        if producer_log is not None:
+            producer_log.join()
+
+    if producer_code != 0:
+        raise RuntimeError(f"producer exited with code {producer_code}")
+
+
 def _resolve_converter_path(request: ConversionRequest) -> Path:
     """Resolve the ffmpeg binary to use for conversion.
     
     Checks explicit path, environment variables, pydub configuration,
-    and system PATH.
+    and system PATH. pydub is only consulted when it has already been
+    imported elsewhere (or ``HARMONIX_USE_PYDUB`` is set), so conversion
+    never pays for loading it. Results are memoized on every input that
+    can change the answer, so repeated batches skip the filesystem probes.
     
     Args:
         request: Conversion request containing optional explicit path.
@@ -342,35 +1012,54 @@ def _resolve_converter_path(request: ConversionRequest) -> Path:
     Raises:
         MissingEncoderError: If FFmpeg cannot be found.
     """
-
-    candidates = []
-
-    if request.ffmpeg_path:
-        candidates.append(request.ffmpeg_path)
-
-    env_candidates = [
+    pydub_converter = None
+    pydub_module = sys.modules.get("pydub")
+    if pydub_module is None and os.environ.get("HARMONIX_USE_PYDUB"):
+        try:
+            import pydub as pydub_module  # type: ignore
+        except ImportError:
+            pydub_module = None
+    if pydub_module is not None:
+        audio_segment = getattr(pydub_module, "AudioSegment", None)
+        pydub_converter = getattr(audio_segment, "converter", None)
+    return _resolve_converter_cached(
+        request.ffmpeg_path,
         os.environ.get("FFMPEG_BINARY"),
         os.environ.get("FFMPEG_BIN"),
-    ]
-    candidates.extend(Path(path) for path in env_candidates if path)
+        pydub_converter,
+        os.environ.get("PATH"),
+    )
 
-    # Check pydub's AudioSegment.converter if available
-    try:
-        from pydub import AudioSegment as PydubAudioSegment # type: ignore
-        converter_attr = getattr(PydubAudioSegment, "converter", None)
-        if converter_attr:
-            candidates.append(Path(converter_attr))
-    except ImportError:
-        pass
 
-    from shutil import which
+@lru_cache(maxsize=16)
+def _resolve_converter_cached(
+    explicit_path: Optional[Path],
+    env_binary: Optional[str],
+    env_bin: Optional[str],
+    pydub_converter: Optional[str],
+    search_path: Optional[str],
+) -> Path:
+    """Probe converter candidates in priority order (memoized).
+    
+    Failures raise and are therefore never cached.
+    """
+    candidates = []
 
-    default_path = which("ffmpeg")
-    if default_path:
-        candidates.append(Path(default_path))
+    if explicit_path:
+        candidates.append(explicit_path)
+
+    candidates.extend(Path(path) for path in (env_binary, env_bin) if path)
+
+    # pydub's AudioSegment.converter, if configured
+    if pydub_converter:
+        candidates.append(Path(pydub_converter))
 
     for candidate in candidates:
-        if candidate and candidate.exists():
+        if candidate.exists():
             return candidate
 
+    default_path = which("ffmpeg", path=search_path)
+    if default_path:
+        return Path(default_path)
+
     raise MissingEncoderError()
@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Dict, Iterable, Sequence, Tuple
 
 from ..ffmpeg_runner import (
-    AudioSegment,
     AudioProcessingError,
     ExportFailureError,
     NoOutputProducedError,
@@ -18,9 +17,11 @@ from ..ffmpeg_runner import (
     validate_pydub_available,
 )
 
+# pydub is loaded by the handlers that need it, not by ffmpeg_runner
 try:
-    from pydub import effects  # type: ignore
+    from pydub import AudioSegment, effects  # type: ignore
 except ModuleNotFoundError:
+    AudioSegment = None  # type: ignore[assignment]
     effects = None
 
 
@@ -56,11 +57,11 @@ class MasteringRequest:
 
             if not self.overwrite_existing:
                 candidate = base_destination
+                parent = base_destination.parent
                 index = 1
                 while candidate.exists() or candidate in allocated:
-                    candidate = base_destination.with_stem(
-                        f"{base_destination.stem} ({index})"
-                    )
+                    # Path.with_stem needs Python 3.9+
+                    candidate = parent / f"{stem} ({index}){suffix}"
                     index += 1
                 destination = candidate
 
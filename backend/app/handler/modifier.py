@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import json
 import math
+import os
 import subprocess
-from dataclasses import dataclass
+import sys
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional, Sequence, Tuple
 
 from ..ffmpeg_runner import (
     AudioProcessingError,
     ExportFailureError,
     MissingEncoderError,
+    NoOutputProducedError,
+    hidden_window_kwargs,
+    name_key,
     resolve_environment,
+    threads_per_process,
     validate_input_paths,
 )
 
@@ -28,89 +37,130 @@ class ModificationRequest:
     cut_start: float  # percentage 0-100
     cut_end: float  # percentage 0-100
     ffmpeg_path: Optional[Path] = None
+    max_workers: Optional[int] = None  # defaults to the CPU count
+    accurate_cut: bool = False  # decode from 0 for sample-exact cuts
+
+    @property
+    def needs_reencode(self) -> bool:
+        """Whether speed or pitch changes require decoding the audio."""
+        return abs(self.speed - 1.0) > 0.001 or self.pitch != 0
 
     def outputs(self) -> Iterable[Tuple[Path, Path]]:
         """Yield tuples of ``(input_path, output_path)`` for the batch."""
-        allocated: set[Path] = set()
+        # One directory listing up front; conflicts are resolved in memory
+        try:
+            taken = {name_key(name) for name in os.listdir(self.output_directory)}
+        except (FileNotFoundError, NotADirectoryError):
+            taken = set()
 
+        reencode = self.needs_reencode
         for source in self.input_paths:
-            # Output format defaults to wav for modification to preserve quality before final conversion
-            # or we can keep original extension if possible. Let's use wav for safety/compatibility.
-            # Or better, keep original extension if supported, but changing speed/pitch might require re-encoding.
-            # Let's default to .wav for now as intermediate/final output.
-            base_destination = self.output_directory / f"{source.stem}_modified.wav"
-            destination = base_destination
-
-            candidate = base_destination
+            # Speed/pitch changes are re-encoded to wav to preserve quality.
+            # Cut-only jobs are stream-copied, so they keep the source container.
+            suffix = ".wav" if reencode or not source.suffix else source.suffix
+            stem = f"{source.stem}_modified"
+            name = f"{stem}{suffix}"
+
+            # Candidates are plain strings; a Path is built only once
             index = 1
-            while candidate.exists() or candidate in allocated:
-                candidate = base_destination.with_stem(
-                    f"{base_destination.stem} ({index})"
-                )
+            while name_key(name) in taken:
+                name = f"{stem} ({index}){suffix}"
                 index += 1
-            destination = candidate
 
-            allocated.add(destination)
-            yield source, destination
+            taken.add(name_key(name))
+            yield source, self.output_directory / name
 
 
-def get_audio_info(file_path: Path, ffmpeg_path: str = "ffmpeg") -> dict:
-    """Get duration and sample rate using ffprobe."""
-    # We assume ffprobe is next to ffmpeg or in path
-    ffprobe_path = "ffprobe"
+@lru_cache(maxsize=8)
+def _ffprobe_for(ffmpeg_path: str) -> str:
+    """Locate ffprobe, assuming it sits next to ffmpeg or is on PATH."""
     if ffmpeg_path != "ffmpeg":
         probe_candidate = Path(ffmpeg_path).parent / "ffprobe"
         if probe_candidate.exists():
-            ffprobe_path = str(probe_candidate)
-        elif Path(ffmpeg_path).with_name("ffprobe.exe").exists():
-             ffprobe_path = str(Path(ffmpeg_path).with_name("ffprobe.exe"))
+            return str(probe_candidate)
+        if Path(ffmpeg_path).with_name("ffprobe.exe").exists():
+            return str(Path(ffmpeg_path).with_name("ffprobe.exe"))
+    return "ffprobe"
 
+
+@lru_cache(maxsize=256)
+def _probe(file_path: str, mtime: float, ffprobe_path: str) -> Tuple[float, int]:
+    """Run ffprobe once; ``mtime`` only keys the cache so edits invalidate it."""
     cmd = [
         ffprobe_path,
         "-v", "error",
         "-select_streams", "a:0",
         "-show_entries", "stream=duration,sample_rate",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(file_path)
+        "-of", "json",
+        file_path
     ]
-    
+    output = subprocess.check_output(cmd, **hidden_window_kwargs()).decode()
+    stream = json.loads(output)["streams"][0]
+    return float(stream.get("duration", 0)), int(stream.get("sample_rate", 44100))
+
+
+def get_audio_info(file_path: Path, ffmpeg_path: str = "ffmpeg") -> dict:
+    """Get duration and sample rate using ffprobe.
+
+    Results are memoized per ``(path, mtime)``, so re-probing an unchanged
+    file does not spawn another subprocess.
+    """
     try:
-        # On Windows, creationflags=0x08000000 prevents cmd window popping up
-        creationflags = 0
-        if hasattr(subprocess, "CREATE_NO_WINDOW"):
-            creationflags = subprocess.CREATE_NO_WINDOW
-            
-        output = subprocess.check_output(cmd, creationflags=creationflags).decode().strip().split('\n')
-        
-        # Output order depends on show_entries, usually sample_rate then duration or vice versa
-        # But since we requested specific entries, let's parse carefully.
-        # Actually ffprobe output order is consistent with request order? Not always.
-        # Let's use csv format for easier parsing or json.
-        
-        # Retry with json for reliability
-        cmd = [
-            ffprobe_path,
-            "-v", "error",
-            "-select_streams", "a:0",
-            "-show_entries", "stream=duration,sample_rate",
-            "-of", "json",
-            str(file_path)
-        ]
-        import json
-        output = subprocess.check_output(cmd, creationflags=creationflags).decode()
-        data = json.loads(output)
-        stream = data["streams"][0]
-        return {
-            "duration": float(stream.get("duration", 0)),
-            "sample_rate": int(stream.get("sample_rate", 44100))
-        }
+        duration, sample_rate = _probe(
+            os.fspath(file_path), os.path.getmtime(file_path), _ffprobe_for(ffmpeg_path)
+        )
+        return {"duration": duration, "sample_rate": sample_rate}
     except Exception as e:
-        print(f"Error probing file {file_path}: {e}")
+        # stderr: stdout carries the JSON protocol
+        print(f"Error probing file {file_path}: {e}", file=sys.stderr)
         return {"duration": 0, "sample_rate": 44100}
 
 
+def get_audio_info_batch(
+    file_paths: Sequence[Path],
+    ffmpeg_path: str = "ffmpeg",
+    max_workers: Optional[int] = None,
+) -> list[dict]:
+    """Probe several files concurrently, returning infos in input order."""
+    if not file_paths:
+        return []
+
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(file_paths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda path: get_audio_info(path, ffmpeg_path), file_paths)
+        )
+
+
+def _atempo_chain(ratio: float) -> list[str]:
+    """Split a tempo ratio into ``atempo`` filters within FFmpeg's [0.5, 2.0].
+
+    The number of saturated 0.5/2.0 stages is computed in closed form; the
+    residual ratio is emitted last unless it is effectively 1.0.
+    """
+    filters: list[str] = []
+    if ratio < 0.5:
+        stages = math.ceil(math.log2(0.5 / ratio))
+        filters = ["atempo=0.5"] * stages
+        ratio *= 2 ** stages
+    elif ratio > 2.0:
+        stages = math.ceil(math.log2(ratio / 2.0))
+        filters = ["atempo=2.0"] * stages
+        ratio /= 2 ** stages
+
+    if abs(ratio - 1.0) > 0.001:
+        filters.append(f"atempo={ratio}")
+    return filters
+
+
 def build_filter_complex(speed: float, pitch: int, sample_rate: int) -> str:
     """Build FFmpeg filter complex for speed and pitch."""
+    # Batches reuse the same slider values, so the chain is built once
+    return _build_filter_complex(round(speed, 4), pitch, sample_rate)
+
+
+@lru_cache(maxsize=512)
+def _build_filter_complex(speed: float, pitch: int, sample_rate: int) -> str:
     filters = []
     
     # Pitch Shift (Time-Stretch + Resample)
@@ -123,113 +173,173 @@ def build_filter_complex(speed: float, pitch: int, sample_rate: int) -> str:
     # new_rate = sample_rate * ratio
     # tempo_correction = 1 / ratio
     
-    pitch_ratio = 2 ** (pitch / 12.0)
-    new_sample_rate = int(sample_rate * pitch_ratio)
-    
     if pitch != 0:
-        filters.append(f"asetrate={new_sample_rate}")
-        
+        pitch_ratio = 2 ** (pitch / 12.0)
+        filters.append(f"asetrate={int(sample_rate * pitch_ratio)}")
+
         # Counteract speed change from asetrate
-        tempo_correction = 1.0 / pitch_ratio
-        
-        # atempo filter is limited to [0.5, 2.0]
-        # We need to chain multiple atempo filters if outside range
-        while tempo_correction < 0.5:
-            filters.append("atempo=0.5")
-            tempo_correction /= 0.5
-        while tempo_correction > 2.0:
-            filters.append("atempo=2.0")
-            tempo_correction /= 2.0
-        
-        if abs(tempo_correction - 1.0) > 0.001:
-             filters.append(f"atempo={tempo_correction}")
+        filters.extend(_atempo_chain(1.0 / pitch_ratio))
 
     # Apply requested Speed change
     # Speed change also uses atempo
     # If speed is 2.0, duration is halved.
     if abs(speed - 1.0) > 0.001:
-        current_speed = speed
-        while current_speed < 0.5:
-            filters.append("atempo=0.5")
-            current_speed /= 0.5
-        while current_speed > 2.0:
-            filters.append("atempo=2.0")
-            current_speed /= 2.0
-            
-        if abs(current_speed - 1.0) > 0.001:
-            filters.append(f"atempo={current_speed}")
+        filters.extend(_atempo_chain(speed))
             
     return ",".join(filters)
 
 
 def process(request: ModificationRequest) -> list[Path]:
-    """Execute the modification batch."""
+    """Execute the modification batch.
+
+    All sources are probed up front, then files are encoded concurrently on
+    a bounded thread pool, each worker driving its own FFmpeg subprocess.
+    """
+    if not hasattr(request.input_paths, "__len__"):
+        # Lazy inputs would be consumed by validation before outputs()
+        request = replace(request, input_paths=list(request.input_paths))
+
     resolve_environment()
     validate_input_paths(request.input_paths)
 
     ffmpeg_path = "ffmpeg"
     if request.ffmpeg_path:
-        ffmpeg_path = str(request.ffmpeg_path)
+        ffmpeg_path = os.fspath(request.ffmpeg_path)
 
-    processed_files = []
-    total_files = len(request.input_paths)
+    # outputs() is walked exactly once; the total is computed once
+    jobs = list(request.outputs())
+    total_files = len(jobs)
 
-    for i, (source, destination) in enumerate(request.outputs()):
+    def process_one(source: Path, destination: Path, info: dict) -> Path:
         try:
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Get audio info
-            info = get_audio_info(source, ffmpeg_path)
-            duration = info["duration"]
-            sample_rate = info["sample_rate"]
-            
-            # Calculate cut times
-            start_time = (request.cut_start / 100.0) * duration
-            end_time = (request.cut_end / 100.0) * duration
-            
-            # Ensure valid time range
-            if end_time <= start_time:
-                end_time = duration
-                
-            # Build command
-            cmd = [ffmpeg_path, "-y", "-i", str(source)]
-            
-            # Cut logic
-            # Using -ss before -i is faster but less accurate. 
-            # Using -ss after -i is accurate.
-            # Since we are modifying, accuracy is preferred.
-            cmd.extend(["-ss", str(start_time)])
-            cmd.extend(["-to", str(end_time)])
-            
-            # Filter logic
-            filter_str = build_filter_complex(request.speed, request.pitch, sample_rate)
-            if filter_str:
-                cmd.extend(["-filter:a", filter_str])
-            
-            # Output
-            cmd.append(str(destination))
-            
-            # Run
-            creationflags = 0
-            if hasattr(subprocess, "CREATE_NO_WINDOW"):
-                creationflags = subprocess.CREATE_NO_WINDOW
-                
-            subprocess.run(
-                cmd,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=creationflags
-            )
-            
-            processed_files.append(destination)
-
+            _modify_file(request, ffmpeg_path, source, destination, info, threads)
         except subprocess.CalledProcessError as e:
             raise ExportFailureError(source, e, total_files) from e
         except Exception as e:
             raise ExportFailureError(source, e, total_files) from e
+        return destination
+
+    if not jobs:
+        raise NoOutputProducedError()
+
+    max_workers = request.max_workers or os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(jobs)))
+    threads = threads_per_process(max_workers)
+
+    # Probe every source up front so the encode loop only runs FFmpeg
+    infos = get_audio_info_batch(
+        [source for source, _ in jobs], ffmpeg_path, max_workers
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(process_one, source, destination, info)
+            for (source, destination), info in zip(jobs, infos)
+        ]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+        # Surface the first failure in input order
+        for future in futures:
+            if future in done and future.exception() is not None:
+                raise future.exception()
+
+    processed_files = [future.result() for future in futures]
 
     if not processed_files:
         raise NoOutputProducedError()
 
     return processed_files
+
+
+# Intermediate container for piping into another FFmpeg (see
+# SoundConverter.convert_from_stream); matches the converter's WAV codec
+STREAM_OUTPUT = "pipe:1"
+_STREAM_ARGUMENTS = ("-f", "wav", "-c:a", "pcm_s16le")
+
+
+def build_stream_command(request: ModificationRequest, source: Path) -> list[str]:
+    """Build a modifier command that writes WAV to stdout instead of a file.
+
+    Used by combined modify-then-convert pipelines so the intermediate
+    audio never touches the disk.
+    """
+    ffmpeg_path = os.fspath(request.ffmpeg_path) if request.ffmpeg_path else "ffmpeg"
+    info = get_audio_info(source, ffmpeg_path)
+    return _build_command(request, ffmpeg_path, os.fspath(source), STREAM_OUTPUT, info)
+
+
+def _build_command(
+    request: ModificationRequest,
+    ffmpeg_path: str,
+    source: str,
+    destination: str,
+    info: dict,
+    threads: Optional[int] = None,
+) -> list[str]:
+    """Build the FFmpeg command applying cut, speed and pitch to one file."""
+    duration = info["duration"]
+    sample_rate = info["sample_rate"]
+    
+    # Calculate cut times
+    start_time = (request.cut_start / 100.0) * duration
+    end_time = (request.cut_end / 100.0) * duration
+    
+    # Ensure valid time range
+    if end_time <= start_time:
+        end_time = duration
+        
+    # Build command
+    cmd = [ffmpeg_path, "-y"]
+    if threads:
+        cmd.extend(["-threads", str(threads)])
+
+    if request.accurate_cut:
+        # Output-side seek: decodes from 0 and discards up to start_time
+        cmd.extend(["-i", source])
+        cmd.extend(["-ss", str(start_time)])
+        cmd.extend(["-to", str(end_time)])
+    else:
+        # Input-side seek: the demuxer jumps straight to start_time.
+        # Audio frames are short, so this is accurate enough for a cut.
+        cmd.extend(["-ss", str(start_time), "-i", source])
+        cmd.extend(["-t", str(end_time - start_time)])
+    
+    # Filter logic
+    filter_str = build_filter_complex(request.speed, request.pitch, sample_rate)
+    if filter_str:
+        cmd.extend(["-filter:a", filter_str])
+    
+    # Output
+    if destination == STREAM_OUTPUT:
+        cmd.extend(_STREAM_ARGUMENTS)
+    elif not request.needs_reencode and not request.accurate_cut:
+        # Cut only: remux the packets without decoding or encoding. An
+        # accurate cut must re-encode, or copy snaps back to packet bounds
+        cmd.extend(["-c", "copy"])
+    cmd.append(destination)
+    return cmd
+
+
+def _modify_file(
+    request: ModificationRequest,
+    ffmpeg_path: str,
+    source: Path,
+    destination: Path,
+    info: dict,
+    threads: Optional[int] = None,
+) -> None:
+    """Apply cut, speed and pitch changes to a single file."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    cmd = _build_command(
+        request, ffmpeg_path, os.fspath(source), os.fspath(destination), info, threads
+    )
+    
+    # Run
+    subprocess.run(
+        cmd,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **hidden_window_kwargs()
+    )
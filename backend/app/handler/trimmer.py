@@ -2,26 +2,40 @@
 
 from __future__ import annotations
 
+import re
+import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Sequence, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from ..ffmpeg_runner import (
-    AudioSegment,
     AudioProcessingError,
     ExportFailureError,
     NoOutputProducedError,
     format_error_message,
+    hidden_window_kwargs,
     resolve_environment,
     validate_input_paths,
     validate_pydub_available,
 )
 
+# pydub is loaded by the handlers that need it, not by ffmpeg_runner
 try:
-    from pydub import silence  # type: ignore
+    from pydub import AudioSegment, silence  # type: ignore
 except ModuleNotFoundError:
+    AudioSegment = None  # type: ignore[assignment]
     silence = None
 
+# Import handling for optional numpy dependency
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
+
+# Sample widths the vectorized detector decodes exactly (int64 sums of
+# squares cannot overflow); other widths use pydub's own loop
+_FAST_SAMPLE_DTYPES = {1: "<i1", 2: "<i2"}
+
 
 @dataclass(frozen=True)
 class TrimRequest:
@@ -33,6 +47,9 @@ class TrimRequest:
     minimum_silence_ms: int = 500
     padding_ms: int = 0
     overwrite_existing: bool = True
+    # Silence is probed every ``seek_step`` ms, so trim points are accurate
+    # to that resolution; 1 checks every millisecond but is far slower
+    seek_step: int = 10
 
     def outputs(self) -> Iterable[Tuple[Path, Path]]:
         allocated: set[Path] = set()
@@ -43,11 +60,12 @@ class TrimRequest:
 
             if not self.overwrite_existing:
                 candidate = base_destination
+                parent = base_destination.parent
+                stem = base_destination.stem
                 index = 1
                 while candidate.exists() or candidate in allocated:
-                    candidate = base_destination.with_stem(
-                        f"{base_destination.stem} ({index})"
-                    )
+                    # Path.with_stem needs Python 3.9+
+                    candidate = parent / f"{stem} ({index}){suffix}"
                     index += 1
                 destination = candidate
 
@@ -93,21 +111,27 @@ class SilenceTrimmer:
 
         for input_path, output_path in request.outputs():
             try:
-                audio = AudioSegment.from_file(input_path)
-                trimmed = cls._trim_audio(
-                    audio,
-                    silence_threshold=request.silence_threshold,
-                    minimum_silence=request.minimum_silence_ms,
-                    padding=request.padding_ms,
-                )
-                output_format = input_path.suffix.lstrip(".") or "wav"
-                trimmed.export(output_path, format=output_format)
+                cls._trim_file(request, input_path, output_path)
             except Exception as exc:
                 raise ExportFailureError(input_path, exc, len(request.input_paths))
             trimmed_outputs.append(output_path)
 
         return tuple(trimmed_outputs)
 
+    @classmethod
+    def _trim_file(cls, request: TrimRequest, input_path: Path, output_path: Path) -> None:
+        assert AudioSegment is not None
+        audio = AudioSegment.from_file(input_path)
+        trimmed = cls._trim_audio(
+            audio,
+            silence_threshold=request.silence_threshold,
+            minimum_silence=request.minimum_silence_ms,
+            padding=request.padding_ms,
+            seek_step=request.seek_step,
+        )
+        output_format = input_path.suffix.lstrip(".") or "wav"
+        trimmed.export(output_path, format=output_format)
+
     @classmethod
     def _trim_audio(
         cls,
@@ -116,6 +140,7 @@ class SilenceTrimmer:
         silence_threshold: float,
         minimum_silence: int,
         padding: int,
+        seek_step: int = 1,
     ) -> AudioSegment:
         assert silence is not None
 
@@ -124,10 +149,11 @@ class SilenceTrimmer:
         if padding < 0:
             padding = 0
 
-        ranges = silence.detect_nonsilent(
+        ranges = _detect_nonsilent(
             audio,
             min_silence_len=max(0, int(minimum_silence)),
             silence_thresh=float(silence_threshold),
+            seek_step=max(1, int(seek_step)),
         )
 
         if not ranges:
@@ -152,3 +178,195 @@ class SilenceTrimmer:
             request.output_directory if request.output_directory else outputs[0].parent
         )
         return f"Trimmed silence from {len(outputs)} files into {destination_text}"
+
+
+# silencedetect events and the input duration, from FFmpeg's stderr
+_SILENCE_EVENT_RE = re.compile(rb"silence_(start|end): (-?\d+(?:\.\d+)?)")
+_DURATION_RE = re.compile(rb"Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+# Events this close (seconds) to either end count as touching it
+_EDGE_TOLERANCE = 0.01
+
+
+class FFmpegSilenceTrimmer(SilenceTrimmer):
+    """Trim leading and trailing silence using FFmpeg's ``silencedetect``.
+
+    Detection runs inside FFmpeg instead of decoding the file into pydub,
+    and the kept range is stream-copied with ``-ss``/``-t``, so nothing is
+    re-encoded. Boundaries follow FFmpeg's detector and can differ slightly
+    from pydub's. Any file FFmpeg cannot handle falls back to the pydub
+    path.
+    """
+
+    @classmethod
+    def _trim_file(cls, request: TrimRequest, input_path: Path, output_path: Path) -> None:
+        try:
+            cls._trim_with_ffmpeg(request, input_path, output_path)
+        except Exception:
+            super()._trim_file(request, input_path, output_path)
+
+    @classmethod
+    def _trim_with_ffmpeg(cls, request: TrimRequest, input_path: Path, output_path: Path) -> None:
+        ffmpeg = str(getattr(AudioSegment, "converter", None) or "ffmpeg")
+        source = str(input_path)
+
+        detect = subprocess.run(
+            [
+                ffmpeg, "-hide_banner", "-nostats", "-i", source,
+                "-af", (
+                    f"silencedetect=n={float(request.silence_threshold)}dB"
+                    f":d={max(0, int(request.minimum_silence_ms)) / 1000}"
+                ),
+                "-f", "null", "-",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            **hidden_window_kwargs(),
+        )
+        if detect.returncode != 0:
+            raise AudioProcessingError(f"silencedetect failed for {input_path}")
+
+        start, end = _nonsilent_bounds(detect.stderr)
+        padding = max(0, request.padding_ms) / 1000
+        start = max(0.0, start - padding)
+        if end is not None:
+            end += padding
+
+        cmd = [ffmpeg, "-y", "-hide_banner", "-ss", str(start), "-i", source]
+        if end is not None and end > start:
+            cmd.extend(["-t", str(end - start)])
+        cmd.extend(["-c", "copy", str(output_path)])
+        subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            **hidden_window_kwargs(),
+        )
+
+
+def _nonsilent_bounds(stderr: bytes) -> Tuple[float, Optional[float]]:
+    """Return ``(start, end)`` seconds of audio to keep; ``end`` None = to EOF.
+
+    Only silence touching either end of the file is trimmed, matching
+    :meth:`SilenceTrimmer._trim_audio`. A file that is silent throughout
+    is kept whole.
+    """
+    duration_match = _DURATION_RE.search(stderr)
+    if duration_match is None:
+        raise AudioProcessingError("FFmpeg did not report a duration")
+    hours, minutes, seconds = duration_match.groups()
+    duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    # Pair up events; trailing silence may have no silence_end at EOF
+    silences: List[List[float]] = []
+    for kind, value in _SILENCE_EVENT_RE.findall(stderr):
+        if kind == b"start":
+            silences.append([float(value), duration])
+        elif silences:
+            silences[-1][1] = float(value)
+
+    if not silences:
+        return 0.0, None
+
+    start = 0.0
+    end: Optional[float] = None
+    first, last = silences[0], silences[-1]
+    if first[0] <= _EDGE_TOLERANCE:
+        if first[1] >= duration - _EDGE_TOLERANCE:
+            return 0.0, None  # all silence: keep the original
+        start = first[1]
+    if last[1] >= duration - _EDGE_TOLERANCE:
+        end = last[0]
+    return start, end
+
+
+def _detect_nonsilent(
+    audio: AudioSegment,
+    min_silence_len: int,
+    silence_thresh: float,
+    seek_step: int = 1,
+) -> List[List[int]]:
+    """``silence.detect_nonsilent``, vectorized when NumPy can decode the audio."""
+    assert silence is not None
+    if (
+        np is not None
+        and isinstance(audio.raw_data, bytes)
+        and audio.sample_width in _FAST_SAMPLE_DTYPES
+    ):
+        return _fast_detect_nonsilent(audio, min_silence_len, silence_thresh, seek_step)
+    return silence.detect_nonsilent(
+        audio,
+        min_silence_len=min_silence_len,
+        silence_thresh=silence_thresh,
+        seek_step=seek_step,
+    )
+
+
+def _fast_detect_nonsilent(
+    audio: AudioSegment,
+    min_silence_len: int,
+    silence_thresh: float,
+    seek_step: int = 1,
+) -> List[List[int]]:
+    """Port of pydub's ``detect_nonsilent`` using one cumulative sum.
+
+    pydub slices the segment and recomputes the RMS of every window,
+    O(N * W). Here the per-frame energies are summed once, so each
+    window's energy is a difference of two prefix sums. Window bounds,
+    zero padding past the end and the integer-truncated RMS follow
+    pydub/audioop exactly, so the ranges are identical.
+    """
+    seg_len = len(audio)
+    if seg_len < min_silence_len:
+        return [[0, seg_len]]
+
+    threshold = 10 ** (silence_thresh / 20) * audio.max_possible_amplitude
+
+    samples = np.frombuffer(audio.raw_data, dtype=_FAST_SAMPLE_DTYPES[audio.sample_width])
+    channels = audio.channels
+    frame_count = len(samples) // channels
+    energy = np.square(samples[:frame_count * channels].astype(np.int64))
+    prefix = np.zeros(frame_count + 1, dtype=np.int64)
+    np.cumsum(energy.reshape(frame_count, channels).sum(axis=1), out=prefix[1:])
+
+    # Slice starts in ms, always including the last possible window
+    last_start = seg_len - min_silence_len
+    starts = np.arange(0, last_start + 1, seek_step, dtype=np.int64)
+    if last_start % seek_step:
+        starts = np.append(starts, last_start)
+
+    # Same ms -> frame conversion as AudioSegment slicing; frames missing
+    # at the end count as zero-valued padding
+    rate = audio.frame_rate / 1000.0
+    first = (starts * rate).astype(np.int64)
+    last = ((starts + min_silence_len) * rate).astype(np.int64)
+    sums = prefix[np.minimum(last, frame_count)] - prefix[np.minimum(first, frame_count)]
+    lengths = (last - first) * channels
+    mean = np.divide(
+        sums, lengths, out=np.zeros(len(sums), dtype=np.float64), where=lengths > 0
+    )
+    silent = starts[np.floor(np.sqrt(mean)) <= threshold]
+
+    if not len(silent):
+        return [[0, seg_len]]
+
+    # A new silent range starts where the windows neither step contiguously
+    # nor overlap the previous silent window
+    gaps = np.diff(silent)
+    breaks = np.flatnonzero((gaps != seek_step) & (gaps > min_silence_len)) + 1
+    range_starts = silent[np.concatenate(([0], breaks))].tolist()
+    range_ends = (silent[np.concatenate((breaks - 1, [len(silent) - 1]))] + min_silence_len).tolist()
+
+    if range_starts[0] == 0 and range_ends[0] == seg_len:
+        return []
+
+    nonsilent = []
+    previous_end = 0
+    for start, end in zip(range_starts, range_ends):
+        nonsilent.append([previous_end, start])
+        previous_end = end
+    if range_ends[-1] != seg_len:
+        nonsilent.append([previous_end, seg_len])
+    if nonsilent[0] == [0, 0]:
+        nonsilent.pop(0)
+    return nonsilent
@@ -1,48 +1,96 @@
 """Audio-related mathematical utilities.
 
 Provides functions for converting between different audio units (dB, float, samples).
+Scalars take a pure-Python path; sequences and arrays are vectorized with
+NumPy when it is installed.
 """
 
 import math
-from typing import Union
+from functools import lru_cache
+from typing import Any, Union
 
-def db_to_float(db: float) -> float:
+# Import handling for optional numpy dependency
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
+
+_SCALAR_TYPES = (int, float)
+
+
+@lru_cache(maxsize=256)
+def _db_to_float_scalar(db: float) -> float:
+    # UI sliders send the same few dB values over and over
+    return pow(10, db / 20)
+
+
+def _float_to_db_scalar(amplitude: float) -> float:
+    if amplitude <= 0:
+        return -float('inf')
+    return 20 * math.log10(amplitude)
+
+
+def _ms_to_samples_scalar(ms: Union[int, float], sample_rate: int) -> int:
+    if isinstance(ms, int):
+        # Exact integer math; no float rounding before truncation
+        return (ms * sample_rate) // 1000
+    return int(ms * sample_rate / 1000)
+
+
+def db_to_float(db: Any) -> Any:
     """Convert decibels to float amplitude.
 
     Args:
-        db: Value in decibels.
+        db: Value in decibels, or a sequence/array of values.
 
     Returns:
-        Float amplitude (0.0 to 1.0+).
+        Float amplitude (0.0 to 1.0+), or an array of amplitudes.
     """
-    return pow(10, db / 20)
+    if isinstance(db, _SCALAR_TYPES):
+        return _db_to_float_scalar(db)
+    if np is None:
+        return [_db_to_float_scalar(value) for value in db]
+    return np.power(10.0, np.asarray(db, dtype=np.float64) / 20.0)
 
 
-def float_to_db(amplitude: float) -> float:
+def float_to_db(amplitude: Any) -> Any:
     """Convert float amplitude to decibels.
 
     Args:
-        amplitude: Float amplitude.
+        amplitude: Float amplitude, or a sequence/array of amplitudes.
 
     Returns:
-        Value in decibels.
+        Value in decibels (``-inf`` for silence), or an array of values.
     """
-    if amplitude <= 0:
-        return -float('inf')
-    return 20 * math.log10(amplitude)
+    if isinstance(amplitude, _SCALAR_TYPES):
+        return _float_to_db_scalar(amplitude)
+    if np is None:
+        return [_float_to_db_scalar(value) for value in amplitude]
+
+    values = np.asarray(amplitude, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(values > 0, 20.0 * np.log10(values), -np.inf)
 
 
-def ms_to_samples(ms: int, sample_rate: int = 44100) -> int:
+def ms_to_samples(ms: Any, sample_rate: int = 44100) -> Any:
     """Convert milliseconds to number of samples.
 
     Args:
-        ms: Duration in milliseconds.
+        ms: Duration in milliseconds, or a sequence/array of durations.
         sample_rate: Sample rate in Hz.
 
     Returns:
-        Number of samples.
+        Number of samples, or an int64 array of sample counts.
     """
-    return int((ms / 1000) * sample_rate)
+    if isinstance(ms, _SCALAR_TYPES):
+        return _ms_to_samples_scalar(ms, sample_rate)
+    if np is None:
+        return [_ms_to_samples_scalar(value, sample_rate) for value in ms]
+
+    values = np.asarray(ms)
+    if values.dtype.kind in "iu":
+        return values.astype(np.int64) * sample_rate // 1000
+    return (values * sample_rate / 1000).astype(np.int64)
 
 
 def samples_to_ms(samples: int, sample_rate: int = 44100) -> float:
@@ -3,11 +3,14 @@
 Provides safe file operations and file info retrieval.
 """
 
+import math
 import os
 import shutil
+import stat
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Union, Optional
-from datetime import datetime
 
 def safe_delete(path: Union[str, Path]) -> bool:
     """Safely delete a file or directory.
@@ -18,15 +21,24 @@ def safe_delete(path: Union[str, Path]) -> bool:
     Returns:
         True if deleted or didn't exist, False if error.
     """
-    p = Path(path)
-    if not p.exists():
+    # Try the common single-file case first: one syscall, no probing
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
         return True
-        
+    except (IsADirectoryError, PermissionError):
+        # Directories fail unlink with EISDIR on Linux but EPERM/EACCES
+        # on macOS and Windows, so confirm before falling back to rmtree
+        if not os.path.isdir(path):
+            return False
+    except OSError:
+        return False
+
     try:
-        if p.is_dir():
-            shutil.rmtree(p)
-        else:
-            p.unlink()
+        shutil.rmtree(path)
+        return True
+    except FileNotFoundError:
         return True
     except OSError:
         return False
@@ -42,21 +54,52 @@ def get_file_info(path: Union[str, Path]) -> Optional[Dict[str, Union[str, int,
         Dictionary with size, created/modified times, extension.
     """
     p = Path(path)
-    if not p.exists() or not p.is_file():
+    # One stat answers existence, file type and size
+    try:
+        st = os.stat(p)
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
         return None
-        
-    stat = p.stat()
+
     return {
         "name": p.name,
         "extension": p.suffix,
-        "size_bytes": stat.st_size,
-        "size_mb": round(stat.st_size / (1024 * 1024), 2),
-        "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-        "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "size_bytes": st.st_size,
+        "size_mb": round(st.st_size / (1024 * 1024), 2),
+        "created_at": _isoformat_timestamp(st.st_ctime),
+        "modified_at": _isoformat_timestamp(st.st_mtime),
         "absolute_path": str(p.absolute())
     }
 
 
+_localtime = time.localtime
+_modf = math.modf
+_strftime = time.strftime
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S"
+
+
+@lru_cache(maxsize=1024)
+def _isoformat_timestamp(timestamp: float) -> str:
+    """Format a local timestamp like ``datetime.fromtimestamp(ts).isoformat()``.
+
+    C-level ``strftime`` avoids building a ``datetime`` per call; batches of
+    files often share mtimes, so results are also memoized.
+    """
+    # Same rounding as datetime.fromtimestamp (round-half-even on the fraction)
+    fraction, seconds = _modf(timestamp)
+    micros = round(fraction * 1e6)
+    if micros >= 1_000_000:
+        seconds += 1
+        micros -= 1_000_000
+    elif micros < 0:
+        seconds -= 1
+        micros += 1_000_000
+    text = _strftime(_ISO_FMT, _localtime(seconds))
+    # isoformat() omits the fraction entirely when it is zero
+    return f"{text}.{micros:06d}" if micros else text
+
+
 def list_audio_files(directory: Union[str, Path], recursive: bool = False) -> List[Path]:
     """List all audio files in a directory.
 
@@ -67,14 +110,45 @@ def list_audio_files(directory: Union[str, Path], recursive: bool = False) -> Li
     Returns:
         List of Path objects.
     """
-    p = Path(directory)
-    if not p.exists() or not p.is_dir():
-        return []
-        
-    extensions = {'.mp3', '.wav', '.aac', '.m4a', '.flac', '.ogg', '.wma', '.aiff'}
-    pattern = "**/*" if recursive else "*"
-    
-    return [
-        f for f in p.glob(pattern)
-        if f.is_file() and f.suffix.lower() in extensions
-    ]
+    root = os.fspath(directory)
+    if not recursive:
+        # Shallow listing: one scandir, no walker state; missing or
+        # non-directory paths surface as OSError instead of extra stats
+        try:
+            with os.scandir(root) as iterator:
+                return [
+                    Path(entry.path) for entry in iterator
+                    if _has_audio_extension(entry.name) and entry.is_file()
+                ]
+        except OSError:
+            return []
+
+    found: List[str] = []
+    pending = [root]
+    while pending:
+        try:
+            iterator = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with iterator:
+            for entry in iterator:
+                try:
+                    # Cheap name test first; is_file/is_dir use the cached d_type
+                    if _has_audio_extension(entry.name) and entry.is_file():
+                        found.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                except OSError:
+                    continue
+
+    return [Path(path) for path in found]
+
+
+# Lowercase extensions without the dot, matched against DirEntry names
+_AUDIO_EXTENSIONS = frozenset({'mp3', 'wav', 'aac', 'm4a', 'flac', 'ogg', 'wma', 'aiff'})
+
+
+def _has_audio_extension(name: str) -> bool:
+    """Match ``Path(name).suffix`` semantics without building a Path."""
+    stem, dot, extension = name.rpartition('.')
+    return bool(dot and stem) and extension.lower() in _AUDIO_EXTENSIONS
@@ -5,38 +5,63 @@ import string
 import re
 import unicodedata
 
-def random_string(length: int = 8) -> str:
+_CHARS = string.ascii_letters + string.digits
+_SYSTEM_RANDOM = random.SystemRandom()
+
+
+def random_string(length: int = 8, secure: bool = False) -> str:
     """Generate a random alphanumeric string.
 
     Args:
         length: Length of string.
+        secure: Draw from the OS CSPRNG instead of the Mersenne Twister.
 
     Returns:
         Random string.
     """
-    chars = string.ascii_letters + string.digits
-    return ''.join(random.choice(chars) for _ in range(length))
+    source = _SYSTEM_RANDOM if secure else random
+    return ''.join(source.choices(_CHARS, k=length))
+
 
+# Compiled once; slugify runs for every uploaded filename
+_SLUG_INVALID_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEP_RE = re.compile(r'[-\s_]+')
+# Runs of anything that is not a Unicode letter or digit (``\w`` minus ``_``)
+_SLUG_UNICODE_RE = re.compile(r'[\W_]+')
+_normalize = unicodedata.normalize
 
-def slugify(text: str) -> str:
+
+def slugify(text: str, ascii_only: bool = False) -> str:
     """Convert text to a safe filename slug.
 
+    By default the text is NFKC-normalized and casefolded, keeping
+    non-Latin letters, and every run of other characters becomes a single
+    hyphen in one regex pass.
+
     Args:
         text: Input text.
+        ascii_only: Use the legacy NFKD transliteration, which drops
+            characters without an ASCII base and deletes punctuation.
 
     Returns:
         Slugified text (lowercase, no special chars).
     """
+    if not ascii_only:
+        text = _normalize('NFKC', text).casefold()
+        return _SLUG_UNICODE_RE.sub('-', text).strip('-')
+
     # Normalize unicode characters
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
+    text = _normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
     
     # Remove invalid characters
-    text = re.sub(r'[^\w\s-]', '', text).strip().lower()
+    text = _SLUG_INVALID_RE.sub('', text).strip().lower()
     
     # Replace spaces/underscores with hyphens
-    text = re.sub(r'[-\s_]+', '-', text)
-    
-    return text
+    return _SLUG_SEP_RE.sub('-', text)
+
+
+# "00".."59"; joining cached pieces beats per-call ``:02d`` formatting
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
 
 
 def format_duration(seconds: float) -> str:
@@ -51,6 +76,7 @@ def format_duration(seconds: float) -> str:
     m, s = divmod(int(seconds), 60)
     h, m = divmod(m, 60)
     
+    # Floor division keeps m and s in 0..59, so the table always applies
     if h > 0:
-        return f"{h:02d}:{m:02d}:{s:02d}"
-    return f"{m:02d}:{s:02d}"
+        return f"{h:02d}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[s]}"
+    return f"{_TWO_DIGITS[m]}:{_TWO_DIGITS[s]}"
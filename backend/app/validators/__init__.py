@@ -26,15 +26,18 @@ Example:
 
 from .audio_validator import (
     validate_audio_file,
+    validate_audio_files,
     check_file_format,
     verify_file_size,
     validate_path,
+    clear_path_cache,
 )
 from .parameter_validator import (
     validate_conversion_params,
     validate_mastering_params,
     validate_trim_params,
     validate_modify_params,
+    validate_analysis_params,
 )
 from .format_validator import (
     is_valid_format,
@@ -46,14 +49,17 @@ from .format_validator import (
 __all__ = [
     # Audio validation
     "validate_audio_file",
+    "validate_audio_files",
     "check_file_format",
     "verify_file_size",
     "validate_path",
+    "clear_path_cache",
     # Parameter validation
     "validate_conversion_params",
     "validate_mastering_params",
     "validate_trim_params",
     "validate_modify_params",
+    "validate_analysis_params",
     # Format validation
     "is_valid_format",
     "get_supported_formats",
@@ -6,37 +6,83 @@ path validity.
 """
 
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 # Constants
 MAX_FILE_SIZE_MB_DEFAULT = 500
-SUPPORTED_EXTENSIONS = {
+SUPPORTED_EXTENSIONS = frozenset({
     '.mp3', '.wav', '.aac', '.m4a', '.flac', '.ogg', '.wma', '.aiff', '.alac'
-}
+})
+_SUPPORTED_EXTENSIONS_TEXT = ', '.join(sorted(SUPPORTED_EXTENSIONS))
 
+_ERR_EMPTY_PATH = "Path cannot be empty"
 
-def validate_path(path_str: str) -> Tuple[bool, Optional[str]]:
+
+# Results keyed by (abspath, st_mtime_ns, st_size); any edit changes the key
+_VALIDATION_CACHE_SIZE = 4096
+_VALIDATION_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[bool, Optional[str]]]" = OrderedDict()
+
+# Recently missing paths -> expiry (monotonic seconds), so repeated probes
+# skip the stat; bounded, oldest entries are evicted first
+_NEGATIVE_CACHE_TTL = 2.0
+_NEGATIVE_CACHE_SIZE = 1024
+_NEGATIVE_CACHE: "OrderedDict[str, float]" = OrderedDict()
+
+_cache_lock = threading.Lock()
+
+# Concurrent directory lookups in validate_audio_files
+_STAT_WORKERS = 16
+
+
+def _stat_once(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a path once, returning None if it does not exist or is unreadable."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def validate_path(
+    path_str: str,
+    stat_result: Optional[os.stat_result] = None,
+) -> Tuple[bool, Optional[str]]:
     """Validate that a path string is well-formed and exists.
 
     Args:
         path_str: The file system path to validate.
+        stat_result: Optional pre-fetched ``os.stat`` result for the path;
+            when given, no further syscall is made.
 
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if valid, (False, error_message) if invalid.
     """
     if not path_str:
-        return False, "Path cannot be empty"
+        return False, _ERR_EMPTY_PATH
 
     try:
-        path = Path(path_str)
-        if not path.exists():
+        if stat_result is None and _cached_stat(path_str) is None:
             return False, f"Path does not exist: {path_str}"
         return True, None
     except Exception as e:
         return False, f"Invalid path format: {str(e)}"
 
 
+def _suffix(path: str) -> str:
+    """Return the extension like ``PurePath.suffix`` without building a Path."""
+    name = os.path.basename(path.rstrip('/' + os.sep))
+    dot = name.rfind('.')
+    # Dotfiles (".mp3") and trailing dots ("a.") have no suffix
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ''
+
+
 def check_file_format(file_path: Union[str, Path]) -> Tuple[bool, Optional[str]]:
     """Check if the file has a supported audio extension.
 
@@ -46,28 +92,39 @@ def check_file_format(file_path: Union[str, Path]) -> Tuple[bool, Optional[str]]
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if supported, (False, error_message) if not.
     """
-    path = Path(file_path)
-    suffix = path.suffix.lower()
-    
+    return _check_suffix(_suffix(file_path if type(file_path) is str else os.fspath(file_path)))
+
+
+@lru_cache(maxsize=128)
+def _check_suffix(suffix: str) -> Tuple[bool, Optional[str]]:
+    # Keyed on the extension only, so a batch shares a handful of entries
+    # and lower() runs once per distinct spelling
+    suffix = suffix.lower()
     if suffix not in SUPPORTED_EXTENSIONS:
-        return False, f"Unsupported file format: {suffix}. Supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
-    
+        return False, f"Unsupported file format: {suffix}. Supported: {_SUPPORTED_EXTENSIONS_TEXT}"
+
     return True, None
 
 
-def verify_file_size(file_path: Union[str, Path], max_size_mb: int = MAX_FILE_SIZE_MB_DEFAULT) -> Tuple[bool, Optional[str]]:
+def verify_file_size(
+    file_path: Union[str, Path],
+    max_size_mb: int = MAX_FILE_SIZE_MB_DEFAULT,
+    stat_result: Optional[os.stat_result] = None,
+) -> Tuple[bool, Optional[str]]:
     """Verify that the file size is within the allowed limit.
 
     Args:
         file_path: Path to the file.
         max_size_mb: Maximum allowed size in Megabytes.
+        stat_result: Optional pre-fetched ``os.stat`` result for the file.
 
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if within limit, (False, error_message) if exceeded.
     """
-    path = Path(file_path)
     try:
-        size_bytes = path.stat().st_size
+        if stat_result is None:
+            stat_result = os.stat(file_path)
+        size_bytes = stat_result.st_size
         size_mb = size_bytes / (1024 * 1024)
         
         if size_mb > max_size_mb:
@@ -81,7 +138,8 @@ def verify_file_size(file_path: Union[str, Path], max_size_mb: int = MAX_FILE_SI
 def validate_audio_file(file_path: Union[str, Path]) -> Tuple[bool, Optional[str]]:
     """Comprehensive validation of an audio file.
 
-    Performs all checks: existence, format, and size.
+    Performs all checks: existence, format, and size, sharing a single
+    ``stat`` call between them.
 
     Args:
         file_path: Path to the audio file.
@@ -89,10 +147,139 @@ def validate_audio_file(file_path: Union[str, Path]) -> Tuple[bool, Optional[str
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if all checks pass, (False, error_message) if any fail.
     """
-    # 1. Validate path existence
-    exists, error = validate_path(str(file_path))
-    if not exists:
-        return False, error
+    return _validate_with_stat(file_path, _stat_once(file_path) if file_path else None)
+
+
+def validate_audio_files(
+    file_paths: Iterable[Union[str, Path]],
+    max_workers: int = _STAT_WORKERS,
+) -> List[Tuple[bool, Optional[str]]]:
+    """Validate many audio files, batching metadata lookups per directory.
+
+    Files sharing a parent directory are looked up with one ``os.scandir``
+    of that directory; the ``DirEntry`` stat results are reused for the
+    size check. Names missing from the listing (e.g. a different case on
+    a case-insensitive filesystem) fall back to a direct ``stat``.
+    Lookups for different directories are independent and syscall-bound,
+    so they overlap on a small thread pool.
+
+    Args:
+        file_paths: Paths to the audio files.
+        max_workers: Upper bound on concurrent directory lookups.
+
+    Returns:
+        List of ``(is_valid, error_message)`` tuples in input order.
+    """
+    paths = list(file_paths)
+    stats: List[Optional[os.stat_result]] = [None] * len(paths)
+
+    by_parent: Dict[str, List[int]] = {}
+    for index, file_path in enumerate(paths):
+        if file_path:
+            parent = os.path.dirname(os.fspath(file_path)) or os.curdir
+            by_parent.setdefault(parent, []).append(index)
+
+    def lookup(group: Tuple[str, List[int]]) -> None:
+        parent, indices = group
+        entries: Dict[str, os.DirEntry] = {}
+        if len(indices) > 1:
+            try:
+                with os.scandir(parent) as iterator:
+                    entries = {entry.name: entry for entry in iterator}
+            except OSError:
+                pass
+
+        for index in indices:
+            entry = entries.get(os.path.basename(os.fspath(paths[index])))
+            if entry is None:
+                stats[index] = _stat_once(paths[index])
+                continue
+            try:
+                stats[index] = entry.stat()
+            except OSError:
+                stats[index] = None
+
+    groups = list(by_parent.items())
+    workers = max(1, min(max_workers, len(groups)))
+    if workers == 1:
+        for group in groups:
+            lookup(group)
+    else:
+        # Each group writes disjoint indices of ``stats``
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lookup, groups))
+
+    return [_validate_with_stat(path, stat) for path, stat in zip(paths, stats)]
+
+
+def _cached_stat(file_path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a path unless it was found missing within the negative-cache TTL.
+
+    Used by :func:`validate_path` only: full audio validation always stats,
+    so files written moments ago by a handler are never reported missing.
+    """
+    key = os.path.abspath(file_path)
+    now = time.monotonic()
+    with _cache_lock:
+        expires = _NEGATIVE_CACHE.get(key)
+        if expires is not None:
+            if expires > now:
+                return None
+            del _NEGATIVE_CACHE[key]
+
+    stat_result = _stat_once(file_path)
+    if stat_result is None:
+        with _cache_lock:
+            _NEGATIVE_CACHE[key] = now + _NEGATIVE_CACHE_TTL
+            _NEGATIVE_CACHE.move_to_end(key)
+            if len(_NEGATIVE_CACHE) > _NEGATIVE_CACHE_SIZE:
+                _NEGATIVE_CACHE.popitem(last=False)
+    return stat_result
+
+
+def clear_path_cache() -> None:
+    """Forget cached missing paths.
+
+    Call after creating files that may have been probed within the last
+    ``_NEGATIVE_CACHE_TTL`` seconds, so they are not reported as missing.
+    """
+    with _cache_lock:
+        _NEGATIVE_CACHE.clear()
+
+
+def _validate_with_stat(
+    file_path: Union[str, Path],
+    stat_result: Optional[os.stat_result],
+) -> Tuple[bool, Optional[str]]:
+    """Run the checks for one stat result, memoizing results of existing files."""
+    if not file_path or stat_result is None:
+        return _run_checks(file_path, stat_result)
+
+    key = (os.path.abspath(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+    with _cache_lock:
+        cached = _VALIDATION_CACHE.get(key)
+        if cached is not None:
+            _VALIDATION_CACHE.move_to_end(key)
+            return cached
+
+    result = _run_checks(file_path, stat_result)
+    with _cache_lock:
+        _VALIDATION_CACHE[key] = result
+        if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.popitem(last=False)
+    return result
+
+
+def _run_checks(
+    file_path: Union[str, Path],
+    stat_result: Optional[os.stat_result],
+) -> Tuple[bool, Optional[str]]:
+    """Run the existence, format and size checks against one stat result."""
+    # 1. Validate path existence (a missing stat means it is gone)
+    if not file_path:
+        return False, _ERR_EMPTY_PATH
+    if stat_result is None:
+        return False, f"Path does not exist: {file_path}"
 
     # 2. Check format
     valid_format, error = check_file_format(file_path)
@@ -100,7 +287,7 @@ def validate_audio_file(file_path: Union[str, Path]) -> Tuple[bool, Optional[str
         return False, error
 
     # 3. Check size
-    valid_size, error = verify_file_size(file_path)
+    valid_size, error = verify_file_size(file_path, stat_result=stat_result)
     if not valid_size:
         return False, error
 
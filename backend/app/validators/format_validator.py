@@ -4,20 +4,29 @@ This module validates technical audio specifications including sample rates,
 bitrates, and container formats.
 """
 
+from functools import lru_cache
 from typing import Tuple, Optional, List
 
-# Constants
-VALID_SAMPLE_RATES = [
+# Constants (frozensets for O(1) membership tests)
+VALID_SAMPLE_RATES = frozenset({
     8000, 11025, 16000, 22050, 32000, 44100, 48000, 88200, 96000, 192000
-]
+})
 
-VALID_BITRATES = [
-    "32k", "64k", "96k", "128k", "160k", "192k", "256k", "320k"
-]
+_BITRATE_ORDER = ("32k", "64k", "96k", "128k", "160k", "192k", "256k", "320k")
+VALID_BITRATES = frozenset(_BITRATE_ORDER)
 
-SUPPORTED_OUTPUT_FORMATS = [
+SUPPORTED_OUTPUT_FORMATS = frozenset({
     "mp3", "wav", "aac", "m4a", "flac", "ogg", "wma", "aiff"
-]
+})
+
+_SUPPORTED_FORMATS_SORTED: Tuple[str, ...] = tuple(sorted(SUPPORTED_OUTPUT_FORMATS))
+
+# Error message fragments, rendered once in a stable order
+_SAMPLE_RATES_TEXT = str(sorted(VALID_SAMPLE_RATES))
+_BITRATES_TEXT = str(list(_BITRATE_ORDER))
+
+_ERR_SAMPLE_RATE_TYPE = "Sample rate must be an integer"
+_ERR_BITRATE_TYPE = "Bitrate must be a string"
 
 
 def get_supported_formats() -> List[str]:
@@ -26,7 +35,8 @@ def get_supported_formats() -> List[str]:
     Returns:
         List[str]: List of format extensions.
     """
-    return sorted(SUPPORTED_OUTPUT_FORMATS)
+    # Fresh list so callers cannot mutate the shared tuple
+    return list(_SUPPORTED_FORMATS_SORTED)
 
 
 def is_valid_format(fmt: str) -> bool:
@@ -38,6 +48,14 @@ def is_valid_format(fmt: str) -> bool:
     Returns:
         bool: True if supported.
     """
+    if type(fmt) is str:
+        return _is_supported_format(fmt)
+    # Non-string payload values fail the same way they always have
+    return fmt.lower().strip('.') in SUPPORTED_OUTPUT_FORMATS
+
+
+@lru_cache(maxsize=128)
+def _is_supported_format(fmt: str) -> bool:
     return fmt.lower().strip('.') in SUPPORTED_OUTPUT_FORMATS
 
 
@@ -51,10 +69,15 @@ def validate_sample_rate(rate: int) -> Tuple[bool, Optional[str]]:
         Tuple[bool, Optional[str]]: (True, None) if valid.
     """
     if not isinstance(rate, int):
-        return False, "Sample rate must be an integer"
-        
+        return False, _ERR_SAMPLE_RATE_TYPE
+    return _check_sample_rate(rate)
+
+
+@lru_cache(maxsize=256)
+def _check_sample_rate(rate: int) -> Tuple[bool, Optional[str]]:
+    # Requests reuse a handful of values; hits return the same cached tuple
     if rate not in VALID_SAMPLE_RATES:
-        return False, f"Unsupported sample rate: {rate}. Valid: {VALID_SAMPLE_RATES}"
+        return False, f"Unsupported sample rate: {rate}. Valid: {_SAMPLE_RATES_TEXT}"
         
     return True, None
 
@@ -69,16 +92,22 @@ def validate_bitrate(bitrate: str) -> Tuple[bool, Optional[str]]:
         Tuple[bool, Optional[str]]: (True, None) if valid.
     """
     if not isinstance(bitrate, str):
-        return False, "Bitrate must be a string"
-        
+        return False, _ERR_BITRATE_TYPE
+    return _check_bitrate(bitrate)
+
+
+@lru_cache(maxsize=256)
+def _check_bitrate(bitrate: str) -> Tuple[bool, Optional[str]]:
+    # Capped: the value comes straight from the request payload
     if bitrate not in VALID_BITRATES:
         # Also check if it's a raw number convertible to int
         try:
-            val = int(bitrate.replace('k', ''))
+            # Only a trailing 'k' is a unit; slicing avoids a replace() copy
+            val = int(bitrate[:-1] if bitrate.endswith('k') else bitrate)
             if 32 <= val <= 320:
                 return True, None
         except ValueError:
             pass
-        return False, f"Invalid bitrate: {bitrate}. Standard: {VALID_BITRATES}"
+        return False, f"Invalid bitrate: {bitrate}. Standard: {_BITRATES_TEXT}"
         
     return True, None
@@ -1,12 +1,165 @@
 """Processing parameter validation utilities.
 
 This module validates the configuration dictionaries passed to various
-processing handlers (converter, mastering, trimmer, modifier).
+processing handlers (converter, mastering, trimmer, modifier). Each
+operation is described by a declarative schema that one loop evaluates.
 """
 
-from typing import Dict, Any, Tuple, Optional
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 from .format_validator import is_valid_format, validate_bitrate, validate_sample_rate
 
+# A check returns an error message, or None when the value is valid
+Check = Callable[[Any], Optional[str]]
+# (key, required, check)
+Schema = Tuple[Tuple[str, bool, Check], ...]
+
+_VALID_PRESETS = ("music", "podcast", "voiceover", "custom")
+
+# Error messages for the per-call paths; schema messages below are already
+# module-level literals
+_ERR_EMPTY_PARAMS = "Parameters cannot be empty"
+_ERR_MISSING_PARAM = "Missing required parameter: {}"
+_ERR_FORMAT = "Unsupported output format: {}"
+_ERR_PRESET = "Invalid preset: {}. Valid: " + str(list(_VALID_PRESETS))
+
+
+def _number(
+    convert: Callable[[Any], float],
+    type_error: str,
+    low: float = -math.inf,
+    high: float = math.inf,
+    range_error: str = "",
+) -> Check:
+    """Build a check that coerces a value with ``convert`` and bounds it.
+
+    Without bounds there is no range check at all, so NaN passes as it did
+    before the schema; with bounds (which NaN always fails) a
+    ``range_error`` is required so a rejection never has an empty message.
+    """
+    bounded = low != -math.inf or high != math.inf
+    if bounded and not range_error:
+        raise ValueError("range_error is required when bounds are given")
+
+    def check(value: Any) -> Optional[str]:
+        try:
+            number = convert(value)
+        except (ValueError, TypeError, OverflowError):  # int(inf) overflows
+            return type_error
+        if bounded and not (low <= number <= high):
+            return range_error
+        return None
+    return check
+
+
+def _check_format(fmt: Any) -> Optional[str]:
+    return None if is_valid_format(fmt) else _ERR_FORMAT.format(fmt)
+
+
+def _check_preset(preset: Any) -> Optional[str]:
+    if preset and preset not in _VALID_PRESETS:
+        return _ERR_PRESET.format(preset)
+    return None
+
+
+# Shared by every operation that fans out over files
+_check_concurrent_files = _number(
+    int, "Concurrent files must be an integer",
+    low=1, range_error="Concurrent files must be at least 1",
+)
+
+_CONVERSION_SCHEMA: Schema = (
+    ("format", True, _check_format),
+    ("bitrate", False, lambda value: validate_bitrate(value)[1]),
+    ("sample_rate", False, lambda value: validate_sample_rate(value)[1]),
+    ("concurrent_files", False, _check_concurrent_files),
+)
+
+_ANALYSIS_SCHEMA: Schema = (
+    ("concurrent_files", False, _check_concurrent_files),
+)
+
+_MASTERING_SCHEMA: Schema = (
+    ("preset", False, _check_preset),
+    ("target_lufs", False, _number(
+        float, "Target LUFS must be a number",
+        -50, 0, "Target LUFS must be between -50 and 0",
+    )),
+)
+
+_TRIM_SCHEMA: Schema = (
+    # Threshold (dB)
+    ("threshold", False, _number(
+        float, "Threshold must be a number",
+        high=0, range_error="Silence threshold must be negative (dB)",
+    )),
+    # Min Silence Length (ms)
+    ("min_silence_len", False, _number(
+        int, "Minimum silence length must be an integer",
+        low=0, range_error="Minimum silence length must be positive",
+    )),
+)
+
+_MODIFY_SCHEMA: Schema = (
+    # Speed (0.1x to 10.0x)
+    ("speed", False, _number(
+        float, "Speed must be a number",
+        0.1, 10.0, "Speed must be between 0.1 and 10.0",
+    )),
+    # Pitch (semitones)
+    ("pitch", False, _number(float, "Pitch must be a number")),
+)
+
+
+# Placeholder for schema keys absent from the params
+_MISSING = object()
+
+
+def _run_schema(params: Dict[str, Any], schema: Schema) -> Tuple[bool, Optional[str]]:
+    """Validate ``params`` against ``schema``, stopping at the first error.
+
+    Batches validate the same settings repeatedly, so results are cached on
+    the schema's own keys; other entries (file lists etc.) do not affect it.
+    """
+    if not params:
+        return False, _ERR_EMPTY_PARAMS
+
+    # Type is part of the key so 1, 1.0 and True are not conflated
+    values = tuple(
+        (type(value), value)
+        for value in (params.get(key, _MISSING) for key, _, _ in schema)
+    )
+    try:
+        return _run_schema_cached(values, schema)
+    except TypeError:  # unhashable value
+        return _check_values(values, schema)
+
+
+@lru_cache(maxsize=64)
+def _run_schema_cached(
+    values: Tuple[Tuple[type, Any], ...], schema: Schema
+) -> Tuple[bool, Optional[str]]:
+    return _check_values(values, schema)
+
+
+def _check_values(
+    values: Tuple[Tuple[type, Any], ...], schema: Schema
+) -> Tuple[bool, Optional[str]]:
+    for (_, value), (key, required, check) in zip(values, schema):
+        if value is _MISSING:
+            if not required:
+                continue
+            value = None
+
+        if required and not value:
+            return False, _ERR_MISSING_PARAM.format(key)
+        error = check(value)
+        if error is not None:
+            return False, error
+
+    return True, None
+
 
 def validate_conversion_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """Validate parameters for audio conversion.
@@ -18,30 +171,7 @@ def validate_conversion_params(params: Dict[str, Any]) -> Tuple[bool, Optional[s
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if valid.
     """
-    if not params:
-        return False, "Parameters cannot be empty"
-
-    # Validate Format
-    fmt = params.get("format")
-    if not fmt:
-        return False, "Missing required parameter: format"
-    
-    if not is_valid_format(fmt):
-        return False, f"Unsupported output format: {fmt}"
-
-    # Validate Bitrate (if present)
-    if "bitrate" in params:
-        valid, error = validate_bitrate(params["bitrate"])
-        if not valid:
-            return False, error
-
-    # Validate Sample Rate (if present)
-    if "sample_rate" in params:
-        valid, error = validate_sample_rate(params["sample_rate"])
-        if not valid:
-            return False, error
-
-    return True, None
+    return _run_schema(params, _CONVERSION_SCHEMA)
 
 
 def validate_mastering_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -54,25 +184,7 @@ def validate_mastering_params(params: Dict[str, Any]) -> Tuple[bool, Optional[st
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if valid.
     """
-    if not params:
-        return False, "Parameters cannot be empty"
-
-    preset = params.get("preset")
-    valid_presets = ["music", "podcast", "voiceover", "custom"]
-    
-    if preset and preset not in valid_presets:
-        return False, f"Invalid preset: {preset}. Valid: {valid_presets}"
-
-    # Validate Target LUFS
-    if "target_lufs" in params:
-        try:
-            lufs = float(params["target_lufs"])
-            if not (-50 <= lufs <= 0):
-                return False, "Target LUFS must be between -50 and 0"
-        except (ValueError, TypeError):
-            return False, "Target LUFS must be a number"
-
-    return True, None
+    return _run_schema(params, _MASTERING_SCHEMA)
 
 
 def validate_trim_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -85,28 +197,7 @@ def validate_trim_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if valid.
     """
-    if not params:
-        return False, "Parameters cannot be empty"
-
-    # Threshold (dB)
-    if "threshold" in params:
-        try:
-            thresh = float(params["threshold"])
-            if thresh > 0:
-                return False, "Silence threshold must be negative (dB)"
-        except (ValueError, TypeError):
-            return False, "Threshold must be a number"
-
-    # Min Silence Length (ms)
-    if "min_silence_len" in params:
-        try:
-            length = int(params["min_silence_len"])
-            if length < 0:
-                return False, "Minimum silence length must be positive"
-        except (ValueError, TypeError):
-            return False, "Minimum silence length must be an integer"
-
-    return True, None
+    return _run_schema(params, _TRIM_SCHEMA)
 
 
 def validate_modify_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -119,23 +210,17 @@ def validate_modify_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]
     Returns:
         Tuple[bool, Optional[str]]: (True, None) if valid.
     """
-    if not params:
-        return False, "Parameters cannot be empty"
+    return _run_schema(params, _MODIFY_SCHEMA)
 
-    # Speed (0.5x to 4.0x)
-    if "speed" in params:
-        try:
-            speed = float(params["speed"])
-            if not (0.1 <= speed <= 10.0):
-                return False, "Speed must be between 0.1 and 10.0"
-        except (ValueError, TypeError):
-            return False, "Speed must be a number"
 
-    # Pitch (semitones)
-    if "pitch" in params:
-        try:
-            float(params["pitch"])
-        except (ValueError, TypeError):
-            return False, "Pitch must be a number"
+def validate_analysis_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Validate parameters for audio analysis.
 
-    return True, None
+    Args:
+        params: Dictionary containing analysis settings.
+                Expected keys: concurrent_files (optional).
+
+    Returns:
+        Tuple[bool, Optional[str]]: (True, None) if valid.
+    """
+    return _run_schema(params, _ANALYSIS_SCHEMA)
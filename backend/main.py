@@ -2,16 +2,22 @@
 
 This module acts as the CLI entrypoint for the audio conversion backend.
 It reads a JSON object from stdin, executes the conversion, and prints
-JSON updates to stdout.
+JSON updates to stdout. ``--daemon`` keeps it running for one request
+per stdin line.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import re
+import subprocess
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 # Add vendor directory to Python path for bundled dependencies (e.g., pydub)
 # This ensures dependencies installed via `pip install --target backend/vendor`
@@ -20,19 +26,26 @@ _vendor_dir = Path(__file__).parent / "vendor"
 if _vendor_dir.exists():
     sys.path.insert(0, str(_vendor_dir))
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    # ``orjson`` is an optional speed-up; the stdlib parser is the fallback
+    orjson = None
+
 from app.handler.converter import ConversionProgress, ConversionRequest, SoundConverter
 from app.handler.mastering import MasteringEngine, MasteringParameters, MasteringRequest
 from app.handler.modifier import ModificationRequest, process as process_modification
-from app.handler.trimmer import SilenceTrimmer, TrimRequest
-from utils import ensure_ffmpeg, log_message
+from app.handler.trimmer import FFmpegSilenceTrimmer, SilenceTrimmer, TrimRequest
+from utils import ensure_ffmpeg, flush_log, log_message
 
 # Import new modules
-from app.validators.audio_validator import validate_audio_file
+from app.validators.audio_validator import clear_path_cache, validate_audio_file
 from app.validators.parameter_validator import (
     validate_conversion_params,
     validate_mastering_params,
     validate_trim_params,
-    validate_modify_params
+    validate_modify_params,
+    validate_analysis_params
 )
 from app.formatters.output_formatter import (
     format_success,
@@ -42,6 +55,27 @@ from app.formatters.output_formatter import (
 from app.exceptions.base import HarmonixError
 
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+_stdout = sys.stdout.buffer
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, default=str, ensure_ascii=False).encode()
+
+
+def _emit(payload: Dict[str, Any]) -> None:
+    """Write one JSON line to stdout and flush it.
+
+    Writes go straight to the binary buffer, skipping the text layer's
+    str encoding and its separate flush.
+    """
+    _stdout.write(_dumps(payload) + b"\n")
+    _stdout.flush()
+
+
 def emit_progress(progress: Union[ConversionProgress, Dict[str, Any]]) -> None:
     """Emit progress updates to stdout as JSON.
     
@@ -57,78 +91,126 @@ def emit_progress(progress: Union[ConversionProgress, Dict[str, Any]]) -> None:
             "file": str(progress.source),
             "destination": str(progress.destination),
         }
+        if progress.position is not None:
+            payload["position"] = round(progress.position, 3)
     else:
         payload = progress
 
-    print(json.dumps(payload))
-    sys.stdout.flush()
+    # Progress marks the start or end of blocking work; don't leave log
+    # lines from before it sitting in the buffer meanwhile
+    flush_log()
+    _emit(payload)
 
 
 def main() -> None:
-    """Read JSON from stdin, run conversion, and print result."""
+    """Read JSON from stdin, run conversion, and print result.
+
+    With ``--daemon`` the process stays alive and serves one JSON request
+    per stdin line instead, so interpreter start-up, imports and the
+    FFmpeg lookup are paid once for a whole session.
+    """
 
     # 1. Setup environment
     ffmpeg_path = ensure_ffmpeg()
     log_message("python", f"Backend initialized (ffmpeg={ffmpeg_path})")
 
+    if "--daemon" in sys.argv[1:]:
+        _serve(ffmpeg_path)
+        return
+
     # 2. Read input
-    try:
-        raw_input = sys.stdin.read()
-        if not raw_input.strip():
-            # If no input, just print ready message (for health checks)
-            print(json.dumps({"status": "ready", "message": "Backend ready"}))
-            return
+    # Raw bytes: both parsers accept UTF-8 directly, so the payload is
+    # never copied into an intermediate str
+    raw_input = sys.stdin.buffer.read()
+    if not raw_input.strip():
+        # If no input, just print ready message (for health checks)
+        _emit({"status": "ready", "message": "Backend ready"})
+        return
+
+    data = _parse_request(raw_input)
+    if data is None or not _dispatch(data, ffmpeg_path):
+        sys.exit(1)
 
-        data = json.loads(raw_input)
+
+def _serve(ffmpeg_path: Optional[Path]) -> None:
+    """Handle newline-delimited JSON requests until stdin closes."""
+    _emit({"status": "ready", "message": "Backend ready"})
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        data = _parse_request(line)
+        if data is not None:
+            _dispatch(data, ffmpeg_path)
+        # Outputs of this request may have been probed as missing earlier
+        clear_path_cache()
+        flush_log()
+
+
+def _parse_request(raw_input: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one request, emitting an error response if it is malformed."""
+    try:
+        data = _json_loads(raw_input)
     except json.JSONDecodeError as e:
-        print(json.dumps(format_error("init", f"Invalid JSON input: {e}", "JSON_ERROR")))
-        sys.exit(1)
+        _emit(format_error("init", f"Invalid JSON input: {e}", "JSON_ERROR"))
+        return None
     except Exception as e:
-        print(json.dumps(format_error("init", f"Input error: {e}", "INPUT_ERROR")))
-        sys.exit(1)
+        _emit(format_error("init", f"Input error: {e}", "INPUT_ERROR"))
+        return None
+
+    if not isinstance(data, dict):
+        _emit(format_error("init", "Input error: expected a JSON object", "INPUT_ERROR"))
+        return None
+    return data
 
+
+def _dispatch(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> bool:
+    """Run one request and report whether it succeeded."""
     # 3. Determine operation type
     operation = data.get("operation", "convert")
 
+    handler = _HANDLERS.get(operation)
+    if handler is None:
+        _emit(format_error("init", f"Unknown operation: {operation}", "INVALID_OPERATION"))
+        return False
+
     try:
-        result = None
-        if operation == "convert":
-            result = handle_conversion(data, ffmpeg_path)
-            if result is None or result.get("status") != "success":
-                sys.exit(1)
-            return
-        elif operation == "master":
-            result = handle_mastering(data)
-        elif operation == "trim":
-            result = handle_trimming(data)
-        elif operation == "modify":
-            result = handle_modification(data)
-        elif operation == "analyze":
-            result = handle_analysis(data)
-        else:
-            print(json.dumps(format_error("init", f"Unknown operation: {operation}", "INVALID_OPERATION")))
-            sys.exit(1)
-
-        if result is not None:
-            print(json.dumps(result))
-            sys.stdout.flush()
-
-        if result is None or result.get("status") != "success":
-            sys.exit(1)
+        flush_log()
+        result = handler(data, ffmpeg_path)
+
+        # Conversion streams its own completion event
+        if result is not None and operation != "convert":
+            _emit(result)
+
+        return result is not None and result.get("status") == "success"
 
     except HarmonixError as he:
         # Handle known custom exceptions
-        print(json.dumps(format_error(operation, he.message, he.code, he.details)))
-        sys.exit(1)
+        _emit(format_error(operation, he.message, he.code, he.details))
+        return False
     except Exception as e:
         # Handle unexpected exceptions
-        print(json.dumps(format_error(
+        _emit(format_error(
             operation, 
             str(e), 
             "FATAL_ERROR", 
             {"traceback": traceback.format_exc()}
-        )))
-        sys.exit(1)
+        ))
+        return False
+
+
+def _prepare_inputs(data: Dict[str, Any]) -> list[Path]:
+    """Collect the request's input paths, dropping repeated entries.
+
+    A file listed twice would otherwise be processed twice into two
+    numbered outputs.
+    """
+    seen = set()
+    input_paths = []
+    for raw_path in data.get("files") or data.get("input_paths") or []:
+        if raw_path not in seen:
+            seen.add(raw_path)
+            input_paths.append(Path(raw_path))
+    return input_paths
 
 
 def handle_conversion(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Optional[Dict[str, Any]]:
@@ -141,11 +223,12 @@ def handle_conversion(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Opti
     Returns:
         Result dictionary or None if failed.
     """
-    input_paths = [Path(p) for p in data.get("files", data.get("input_paths", []))]
+    input_paths = _prepare_inputs(data)
     output_directory = Path(data.get("output") or data.get("output_directory") or ".")
     output_format = data.get("format") or data.get("output_format", "mp3")
     overwrite = data.get("overwrite_existing", True)
-    concurrent_files = data.get("concurrent_files", 1)
+    # One FFmpeg process per worker; default to half the cores
+    concurrent_files = data.get("concurrent_files") or max(1, (os.cpu_count() or 2) // 2)
 
     # Validate parameters
     params_to_validate = {
@@ -168,6 +251,8 @@ def handle_conversion(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Opti
         output_format=output_format,
         overwrite_existing=overwrite,
         ffmpeg_path=ffmpeg_path,
+        # Never more encoders than cores, whatever the client asks for
+        max_workers=min(int(concurrent_files), os.cpu_count() or 1),
     )
 
     try:
@@ -199,9 +284,9 @@ def handle_conversion(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Opti
     }
 
 
-def handle_mastering(data: Dict[str, Any]) -> Dict[str, Any]:
+def handle_mastering(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Dict[str, Any]:
     """Handle audio mastering request."""
-    input_paths = [Path(p) for p in data.get("input_paths", [])]
+    input_paths = _prepare_inputs(data)
     output_directory = Path(data.get("output_directory", "."))
     preset = data.get("preset", "Music")
     overwrite = data.get("overwrite_existing", True)
@@ -250,9 +335,9 @@ def handle_mastering(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def handle_trimming(data: Dict[str, Any]) -> Dict[str, Any]:
+def handle_trimming(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Dict[str, Any]:
     """Handle silence trimming request."""
-    input_paths = [Path(p) for p in data.get("input_paths", [])]
+    input_paths = _prepare_inputs(data)
     output_directory = Path(data.get("output_directory", "."))
     silence_threshold = data.get("silence_threshold", -50.0)
     minimum_silence_ms = data.get("minimum_silence_ms", 500)
@@ -277,7 +362,9 @@ def handle_trimming(data: Dict[str, Any]) -> Dict[str, Any]:
         overwrite_existing=overwrite
     )
 
-    result = SilenceTrimmer.process(request)
+    # Opt-in: detect silence inside FFmpeg instead of decoding via pydub
+    trimmer = FFmpegSilenceTrimmer if os.environ.get("HARMONIX_FFMPEG_TRIM") else SilenceTrimmer
+    result = trimmer.process(request)
 
     status = "success" if result.success else "error"
     response_data = {
@@ -297,14 +384,15 @@ def handle_trimming(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def handle_modification(data: Dict[str, Any]) -> Dict[str, Any]:
+def handle_modification(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Dict[str, Any]:
     """Handle audio modification request."""
-    input_paths = [Path(p) for p in data.get("input_paths", [])]
+    input_paths = _prepare_inputs(data)
     output_directory = Path(data.get("output_directory", "."))
     speed = float(data.get("speed", 1.0))
     pitch = int(data.get("pitch", 0))
     cut_start = float(data.get("cut_start", 0.0))
     cut_end = float(data.get("cut_end", 100.0))
+    accurate_cut = bool(data.get("accurate_cut", False))
 
     # Validate
     validation_params = {"speed": speed, "pitch": pitch}
@@ -318,7 +406,8 @@ def handle_modification(data: Dict[str, Any]) -> Dict[str, Any]:
         speed=speed,
         pitch=pitch,
         cut_start=cut_start,
-        cut_end=cut_end
+        cut_end=cut_end,
+        accurate_cut=accurate_cut
     )
 
     try:
@@ -344,138 +433,193 @@ def handle_modification(data: Dict[str, Any]) -> Dict[str, Any]:
         return error_response
 
 
-def handle_analysis(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Handle audio analysis request."""
-    input_paths = [Path(p) for p in data.get("files", data.get("input_paths", []))]
-    if not input_paths:
-        return format_error("analyze", "No input files provided", "NO_INPUT")
+# Only the fields the analysis reads, for the first audio stream; the full
+# -show_format/-show_streams dump (tags, dispositions, every stream) is
+# several times larger to emit and parse
+_PROBE_ENTRIES = (
+    "-select_streams", "a:0",
+    "-show_entries",
+    "format=duration,bit_rate:stream=codec_type,codec_name,channels,sample_rate",
+)
 
-    ffmpeg_path = ensure_ffmpeg()
-    if not ffmpeg_path:
-        log_message("python", "FFmpeg not found during analysis")
-        return format_error("analyze", "FFmpeg not found", "FFMPEG_MISSING")
 
-    log_message("python", f"Starting analysis with ffmpeg: {ffmpeg_path}")
-    ffprobe_path = ffmpeg_path.parent / ("ffprobe.exe" if sys.platform == "win32" else "ffprobe")
-    
-    # Fallback: try system ffprobe if bundled one not found
-    if not ffprobe_path.exists():
-        ffprobe_path = Path("ffprobe")
+# Fields of the ffmpeg -i banner parsed by _analyze_with_ffmpeg
+_DURATION_RE = re.compile(rb"Duration:\s+(\d{2}):(\d{2}):(\d{2}\.\d+)")
+_BITRATE_RE = re.compile(rb"bitrate:\s+(\d+)\s+kb/s")
+# Codec, sample rate and channel layout in one pass over the output
+_AUDIO_STREAM_RE = re.compile(rb"Stream.*Audio:\s+([^,]+),(?:.*,)?\s+(\d+)\s+Hz,\s+([^,]+),")
 
-    results = []
-    import subprocess
-    import re
-
-    def analyze_with_ffmpeg(ffmpeg_bin: Path, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Fallback analysis using ffmpeg stderr output."""
-        try:
-            # Run ffmpeg -i input -f null -
-            # This prints metadata to stderr
-            cmd = [str(ffmpeg_bin), "-i", str(file_path), "-f", "null", "-"]
-            process = subprocess.run(cmd, capture_output=True, text=True)
-            output = process.stderr
-
-            # Parse Duration and bitrate
-            # Duration: 00:03:30.05, start: 0.000000, bitrate: 128 kb/s
-            duration_match = re.search(r"Duration:\s+(\d{2}):(\d{2}):(\d{2}\.\d+)", output)
-            bitrate_match = re.search(r"bitrate:\s+(\d+)\s+kb/s", output)
-            
-            duration = 0.0
-            if duration_match:
-                h, m, s = map(float, duration_match.groups())
-                duration = h * 3600 + m * 60 + s
-            
-            bit_rate = int(bitrate_match.group(1)) * 1000 if bitrate_match else 0
 
-            # Parse Stream info for Audio
-            # Stream #0:0: Audio: aac (LC), 44100 Hz, stereo, fltp, 128 kb/s
-            audio_match = re.search(r"Stream.*Audio:.*,\s+(\d+)\s+Hz,\s+([^,]+),", output)
-            
-            sample_rate = 0
-            channels = 0
-            codec = "unknown"
+def _analyze_with_ffmpeg(ffmpeg_bin: Path, file_path: Path) -> Optional[Dict[str, Any]]:
+    """Fallback analysis using ffmpeg stderr output."""
+    try:
+        # Run ffmpeg -i input -t 0.0001 -f null -
+        # The input header (printed to stderr) is all we parse, so stop
+        # almost immediately instead of decoding the whole file
+        source = [str(ffmpeg_bin), "-hide_banner", "-i", str(file_path)]
+        # Bytes: the patterns run on raw stderr, only matched groups are decoded
+        process = subprocess.run(
+            [*source, "-t", "0.0001", "-f", "null", "-"], capture_output=True
+        )
+        if process.returncode != 0:
+            # Some demuxers choke on the truncated run; retry a full decode
+            process = subprocess.run([*source, "-f", "null", "-"], capture_output=True)
+        output = process.stderr
+
+        # Parse Duration and bitrate
+        # Duration: 00:03:30.05, start: 0.000000, bitrate: 128 kb/s
+        duration_match = _DURATION_RE.search(output)
+        bitrate_match = _BITRATE_RE.search(output)
+        
+        duration = 0.0
+        if duration_match:
+            h, m, s = map(float, duration_match.groups())
+            duration = h * 3600 + m * 60 + s
+        
+        bit_rate = int(bitrate_match.group(1)) * 1000 if bitrate_match else 0
+
+        # Parse Stream info for Audio
+        # Stream #0:0: Audio: aac (LC), 44100 Hz, stereo, fltp, 128 kb/s
+        audio_match = _AUDIO_STREAM_RE.search(output)
+        
+        sample_rate = 0
+        channels = 0
+        codec = "unknown"
+        
+        if audio_match:
+            codec = audio_match.group(1).split()[0].decode("utf-8", "replace")
+            sample_rate = int(audio_match.group(2))
+            channel_str = audio_match.group(3)
+            if b"stereo" in channel_str:
+                channels = 2
+            elif b"mono" in channel_str:
+                channels = 1
+            else:
+                # Try to extract numeric channel count or default to 0 (unknown)
+                channels = 0
+
+        return {
+            "file": str(file_path),
+            "duration": duration,
+            "bit_rate": bit_rate,
+            "channels": channels,
+            "sample_rate": sample_rate,
+            "codec": codec
+        }
+    except Exception as e:
+        log_message("python", f"FFmpeg fallback analysis failed: {e}")
+        return None
+
+
+# Simple heuristic for the preset suggestion: first matching rule wins,
+# anything else is "Music"
+_SUGGESTION_RULES = (
+    ("Voice-over", lambda a: a["channels"] == 1 or a["bit_rate"] < 96000),
+    ("Podcast", lambda a: a["duration"] > 600),  # > 10 mins
+)
+
+
+def _probe_one(file_path: Path, ffprobe_path: Path, ffmpeg_path: Path) -> Dict[str, Any]:
+    """Analyze one file with ffprobe, falling back to parsing ffmpeg output."""
+    analysis = None
+    
+    # Try ffprobe first
+    try:
+        cmd = [
+            str(ffprobe_path),
+            "-v", "quiet",
+            "-print_format", "json",
+            *_PROBE_ENTRIES,
+            str(file_path)
+        ]
+        
+        # Bytes go straight to the JSON parser; no text-mode decode
+        process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        
+        if process.returncode == 0:
+            probe_data = _json_loads(process.stdout)
+            format_info = probe_data.get("format", {})
+            for stream in probe_data.get("streams", ()):
+                if stream.get("codec_type") == "audio":
+                    channels = int(stream.get("channels", 0))
+                    sample_rate = int(stream.get("sample_rate", 0))
+                    codec = stream.get("codec_name", "unknown")
+                    break
+            else:
+                channels = sample_rate = 0
+                codec = "unknown"
             
-            if audio_match:
-                sample_rate = int(audio_match.group(1))
-                channel_str = audio_match.group(2)
-                if "stereo" in channel_str:
-                    channels = 2
-                elif "mono" in channel_str:
-                    channels = 1
-                else:
-                    # Try to extract numeric channel count or default to 0 (unknown)
-                    channels = 0
-                
-                # Extract codec from the part before Hz
-                # Stream #0:0: Audio: aac (LC), ...
-                codec_match = re.search(r"Stream.*Audio:\s+([^,]+),", output)
-                if codec_match:
-                    codec = codec_match.group(1).split()[0]
-
-            return {
+            analysis = {
                 "file": str(file_path),
-                "duration": duration,
-                "bit_rate": bit_rate,
+                "duration": float(format_info.get("duration", 0)),
+                "bit_rate": int(format_info.get("bit_rate", 0)),
                 "channels": channels,
                 "sample_rate": sample_rate,
                 "codec": codec
             }
-        except Exception as e:
-            log_message("python", f"FFmpeg fallback analysis failed: {e}")
-            return None
+    except Exception:
+        pass
+    
+    # Fallback to ffmpeg if ffprobe failed
+    if not analysis:
+        analysis = _analyze_with_ffmpeg(ffmpeg_path, file_path)
 
-    for file_path in input_paths:
-        analysis = None
-        
-        # Try ffprobe first
-        try:
-            cmd = [
-                str(ffprobe_path),
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                "-show_streams",
-                str(file_path)
-            ]
-            
-            process = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if process.returncode == 0:
-                probe_data = json.loads(process.stdout)
-                format_info = probe_data.get("format", {})
-                streams = probe_data.get("streams", [])
-                audio_stream = next((s for s in streams if s.get("codec_type") == "audio"), {})
-                
-                analysis = {
-                    "file": str(file_path),
-                    "duration": float(format_info.get("duration", 0)),
-                    "bit_rate": int(format_info.get("bit_rate", 0)),
-                    "channels": int(audio_stream.get("channels", 0)),
-                    "sample_rate": int(audio_stream.get("sample_rate", 0)),
-                    "codec": audio_stream.get("codec_name", "unknown")
-                }
-        except Exception:
-            pass
-        
-        # Fallback to ffmpeg if ffprobe failed
-        if not analysis:
-            analysis = analyze_with_ffmpeg(ffmpeg_path, file_path)
-
-        if analysis:
-            # Simple heuristic for suggestion
-            suggestion = "Music"
-            if analysis["channels"] == 1 or analysis["bit_rate"] < 96000:
-                suggestion = "Voice-over"
-            elif analysis["duration"] > 600: # > 10 mins
-                suggestion = "Podcast"
-                
-            analysis["suggestion"] = suggestion
-            results.append(analysis)
-        else:
-            results.append({
-                "file": str(file_path),
-                "error": "Analysis failed"
-            })
+    if not analysis:
+        return {
+            "file": str(file_path),
+            "error": "Analysis failed"
+        }
+
+    analysis["suggestion"] = next(
+        (label for label, matches in _SUGGESTION_RULES if matches(analysis)), "Music"
+    )
+    return analysis
+
+
+@lru_cache(maxsize=None)
+def _resolve_ffprobe(ffmpeg_path: Path) -> Path:
+    """Locate ffprobe next to ffmpeg, falling back to the one on PATH."""
+    ffprobe_path = ffmpeg_path.parent / ("ffprobe.exe" if sys.platform == "win32" else "ffprobe")
+    
+    # Fallback: try system ffprobe if bundled one not found
+    if not ffprobe_path.exists():
+        ffprobe_path = Path("ffprobe")
+    return ffprobe_path
+
+
+def handle_analysis(data: Dict[str, Any], ffmpeg_path: Optional[Path]) -> Dict[str, Any]:
+    """Handle audio analysis request.
+
+    Files are probed concurrently; each worker only waits on its own
+    ffprobe/ffmpeg subprocess. The pool defaults to half the CPU count and
+    can be set with ``concurrent_files``.
+    """
+    input_paths = _prepare_inputs(data)
+    if not input_paths:
+        return format_error("analyze", "No input files provided", "NO_INPUT")
+
+    concurrent_files = data.get("concurrent_files")
+    if concurrent_files:
+        is_valid, error = validate_analysis_params({"concurrent_files": concurrent_files})
+        if not is_valid:
+            return format_error("analyze", str(error), "VALIDATION_ERROR")
+
+    if not ffmpeg_path:
+        log_message("python", "FFmpeg not found during analysis")
+        return format_error("analyze", "FFmpeg not found", "FFMPEG_MISSING")
+
+    log_message("python", f"Starting analysis with ffmpeg: {ffmpeg_path}")
+    ffprobe_path = _resolve_ffprobe(ffmpeg_path)
+
+    max_workers = int(concurrent_files or 0) or (os.cpu_count() or 2) // 2
+    max_workers = max(1, min(max_workers, len(input_paths)))
+
+    # map() keeps results in input order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda file_path: _probe_one(file_path, ffprobe_path, ffmpeg_path),
+            input_paths,
+        ))
 
     return {
         "event": "complete",
@@ -487,5 +631,17 @@ def handle_analysis(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Operation name -> handler; every handler takes (data, ffmpeg_path).
+# pydub-based handlers find FFmpeg through the environment that
+# ensure_ffmpeg() prepared, so they ignore the path.
+_HANDLERS: Dict[str, Callable[[Dict[str, Any], Optional[Path]], Optional[Dict[str, Any]]]] = {
+    "convert": handle_conversion,
+    "master": handle_mastering,
+    "trim": handle_trimming,
+    "modify": handle_modification,
+    "analyze": handle_analysis,
+}
+
+
 if __name__ == "__main__":
     main()
@@ -1,14 +1,20 @@
 """Unit tests for the converter module."""
 
+import asyncio
+import io
+import subprocess
+import sys
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from app.handler.converter import (
     SoundConverter,
+    _forward_stderr,
     ConversionRequest,
     ConversionResult,
     ConversionProgress
 )
+from app.ffmpeg_runner import MissingEncoderError
 
 class TestConverter:
     @pytest.fixture
@@ -59,6 +65,24 @@ class TestConverter:
         src, dst = outputs[0]
         assert dst.name == "test (1).mp3"
 
+    def test_conversion_request_no_overwrite_ignores_case(self, tmp_path):
+        input_file = tmp_path / "song.wav"
+        input_file.touch()
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        # Same file as song.mp3 on Windows/macOS filesystems
+        (output_dir / "Song.MP3").touch()
+
+        req = ConversionRequest(
+            input_paths=[input_file],
+            output_directory=output_dir,
+            output_format="mp3",
+            overwrite_existing=False
+        )
+
+        _, dst = next(iter(req.outputs()))
+        assert dst.name == "song (1).mp3"
+
     def test_convert_success(self, tmp_path, mock_ffmpeg, mock_resolve):
         input_file = tmp_path / "test.wav"
         input_file.touch()
@@ -70,16 +94,137 @@ class TestConverter:
             output_format="mp3"
         )
         
-        # Mock validation to avoid pydub check
-        with patch("app.handler.converter.validate_pydub_available"), \
-             patch("app.handler.converter.resolve_environment"):
-            
+        # Conversion no longer requires pydub
+        result = SoundConverter.convert(req)
+        
+        assert result.success is True
+        assert len(result.outputs) == 1
+        assert mock_ffmpeg.call_count == 1
+
+    def test_convert_lazy_input_paths(self, tmp_path, mock_ffmpeg, mock_resolve):
+        input_files = [tmp_path / f"track{i}.wav" for i in range(3)]
+        for f in input_files:
+            f.touch()
+        
+        req = ConversionRequest(
+            input_paths=(f for f in input_files),
+            output_directory=tmp_path / "out",
+            output_format="mp3"
+        )
+        
+        result = SoundConverter.convert(req)
+        
+        assert result.success is True
+        assert len(result.outputs) == 3
+
+    def test_convert_batch_parallel(self, tmp_path, mock_ffmpeg, mock_resolve):
+        input_files = [tmp_path / f"track{i}.wav" for i in range(5)]
+        for f in input_files:
+            f.touch()
+        output_dir = tmp_path / "out"
+        
+        req = ConversionRequest(
+            input_paths=input_files,
+            output_directory=output_dir,
+            output_format="mp3",
+            max_workers=3
+        )
+        
+        progress = []
+        result = SoundConverter.convert(req, progress_callback=progress.append)
+        
+        assert result.success is True
+        # Outputs keep input order regardless of completion order
+        assert [p.name for p in result.outputs] == [f"track{i}.mp3" for i in range(5)]
+        assert mock_ffmpeg.call_count == 5
+        assert mock_resolve.call_count == 1
+        assert len(progress) == 10
+        assert sorted(p.index for p in progress if p.status == "completed") == [1, 2, 3, 4, 5]
+
+    def test_convert_grouped_batch(self, tmp_path, mock_ffmpeg, mock_resolve):
+        input_files = [tmp_path / f"clip{i}.wav" for i in range(5)]
+        for f in input_files:
+            f.touch()
+        
+        req = ConversionRequest(
+            input_paths=input_files,
+            output_directory=tmp_path / "out",
+            output_format="mp3",
+            files_per_process=2
+        )
+        
+        with patch("app.handler.converter._run_ffmpeg_batch") as mock_batch:
             result = SoundConverter.convert(req)
             
             assert result.success is True
-            assert len(result.outputs) == 1
+            assert len(result.outputs) == 5
+            # Groups of 2, 2 and a single leftover file
+            assert mock_batch.call_count == 2
             assert mock_ffmpeg.call_count == 1
 
+    def test_convert_auto_grouped_batch(self, tmp_path, mock_ffmpeg, mock_resolve):
+        input_files = [tmp_path / f"clip{i}.wav" for i in range(6)]
+        for f in input_files:
+            f.touch()
+        
+        req = ConversionRequest(
+            input_paths=input_files,
+            output_directory=tmp_path / "out",
+            output_format="mp3",
+            max_workers=2,
+            files_per_process=0
+        )
+        
+        with patch("app.handler.converter._run_ffmpeg_batch") as mock_batch:
+            result = SoundConverter.convert(req)
+            
+            assert result.success is True
+            # One FFmpeg invocation per worker
+            assert mock_batch.call_count == 2
+            assert mock_ffmpeg.call_count == 0
+
+    def test_convert_grouped_batch_falls_back(self, tmp_path, mock_ffmpeg, mock_resolve):
+        input_files = [tmp_path / f"clip{i}.wav" for i in range(2)]
+        for f in input_files:
+            f.touch()
+        
+        req = ConversionRequest(
+            input_paths=input_files,
+            output_directory=tmp_path / "out",
+            output_format="mp3",
+            files_per_process=2
+        )
+        
+        with patch("app.handler.converter._run_ffmpeg_batch") as mock_batch:
+            mock_batch.side_effect = RuntimeError("ffmpeg exited with code 1")
+            result = SoundConverter.convert(req)
+            
+            assert result.success is True
+            # Each file is retried on its own
+            assert mock_ffmpeg.call_count == 2
+
+    def test_convert_reports_encoded_position(self, tmp_path, mock_resolve):
+        input_file = tmp_path / "test.wav"
+        input_file.touch()
+
+        req = ConversionRequest(
+            input_paths=[input_file],
+            output_directory=tmp_path / "out",
+            output_format="mp3"
+        )
+
+        def fake_run(command, log_callback, progress_callback=None):
+            progress_callback(1.5)
+
+        progress = []
+        with patch("app.handler.converter._hw_codec_for", return_value=None), \
+             patch("app.handler.converter._run_ffmpeg", side_effect=fake_run):
+            result = SoundConverter.convert(req, progress.append)
+
+        assert result.success is True
+        assert [p.status for p in progress] == ["processing", "encoding", "completed"]
+        assert progress[1].position == 1.5
+
     def test_convert_failure(self, tmp_path, mock_ffmpeg, mock_resolve):
         input_file = tmp_path / "test.wav"
         input_file.touch()
@@ -93,10 +238,98 @@ class TestConverter:
         
         mock_ffmpeg.side_effect = RuntimeError("FFmpeg failed")
         
-        with patch("app.handler.converter.validate_pydub_available"), \
-             patch("app.handler.converter.resolve_environment"):
-            
-            result = SoundConverter.convert(req)
-            
-            assert result.success is False
-            assert "FFmpeg failed" in result.message
+        result = SoundConverter.convert(req)
+        
+        assert result.success is False
+        assert "FFmpeg failed" in result.message
+
+    def test_convert_missing_ffmpeg(self, tmp_path, mock_ffmpeg, mock_resolve):
+        input_file = tmp_path / "test.wav"
+        input_file.touch()
+        
+        req = ConversionRequest(
+            input_paths=[input_file],
+            output_directory=tmp_path / "out",
+            output_format="mp3"
+        )
+        
+        mock_resolve.side_effect = MissingEncoderError()
+        
+        result = SoundConverter.convert(req)
+        
+        assert result.success is False
+        assert "ffmpeg" in result.message
+        assert mock_ffmpeg.call_count == 0
+
+    def test_convert_from_stream(self, tmp_path, mock_resolve):
+        input_file = tmp_path / "test.wav"
+        input_file.touch()
+
+        req = ConversionRequest(
+            input_paths=[input_file],
+            output_directory=tmp_path / "out",
+            output_format="mp3"
+        )
+        producer = MagicMock()
+        producer.wait.return_value = 0
+
+        with patch("app.handler.converter.subprocess.Popen", return_value=producer), \
+             patch("app.handler.converter._run_ffmpeg") as mock_run:
+            result = SoundConverter.convert_from_stream(
+                ["ffmpeg", "-i", str(input_file), "-f", "wav", "pipe:1"], req
+            )
+
+        assert result.success is True
+        command = mock_run.call_args[0][0]
+        assert command[command.index("-i") + 1] == "pipe:0"
+        assert command[-1] == str(tmp_path / "out" / "test.mp3")
+        assert mock_run.call_args.kwargs["stdin"] is producer.stdout
+
+    def test_forward_stderr_decodes_chunks_into_lines(self):
+        process = MagicMock()
+        process.stderr = io.BufferedReader(io.BytesIO(b"first\nsec\xffond\r\nlast"))
+        lines = []
+
+        thread = _forward_stderr(process, lines.append)
+        thread.join()
+
+        assert lines == ["first", "sec\ufffdond", "last"]
+        assert _forward_stderr(process, None) is None
+
+    def test_forward_stderr_keeps_split_multibyte_characters(self):
+        # "é" (0xC3 0xA9) arrives split across two reads
+        process = MagicMock()
+        process.stderr.read1.side_effect = [b"caf\xc3", b"\xa9.mp3\ntail\xc3", b""]
+        lines = []
+
+        _forward_stderr(process, lines.append).join()
+
+        assert lines == ["caf\u00e9.mp3", "tail\ufffd"]
+
+    def test_convert_async(self, tmp_path, mock_resolve):
+        input_files = [tmp_path / f"track{i}.wav" for i in range(4)]
+        for f in input_files:
+            f.touch()
+        
+        req = ConversionRequest(
+            input_paths=input_files,
+            output_directory=tmp_path / "out",
+            output_format="mp3",
+            max_workers=2
+        )
+        progress = []
+        
+        with patch("app.handler.converter._convert_file_async") as mock_convert:
+            result = asyncio.run(SoundConverter.convert_async(req, progress.append))
+        
+        assert result.success is True
+        assert [p.name for p in result.outputs] == [f"track{i}.mp3" for i in range(4)]
+        assert mock_convert.call_count == 4
+        assert len(progress) == 8
+
+    def test_import_does_not_load_pydub(self):
+        # Fresh interpreter: the test session itself may already hold pydub
+        backend = Path(__file__).resolve().parent.parent
+        code = "import sys, app.handler.converter; sys.exit('pydub' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=backend)
+        assert result.returncode == 0
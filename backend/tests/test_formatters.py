@@ -1,7 +1,9 @@
 """Unit tests for the formatters module."""
 
 import pytest
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 from app.formatters.output_formatter import (
     format_success,
     format_error,
@@ -10,6 +12,7 @@ from app.formatters.output_formatter import (
 )
 from app.formatters.path_formatter import (
     sanitize_filename,
+    generate_output_path,
     ensure_unique_path
 )
 
@@ -36,6 +39,26 @@ class TestOutputFormatter:
         assert result["progress"]["percent"] == 50.0
         assert result["progress"]["file"] == "test.mp3"
 
+    def test_format_progress_reuses_timestamp(self):
+        clock = iter([0, 1_000_000, 1_000_000_000])
+        times = iter([datetime(2024, 1, 1, 0, 0, 0), datetime(2024, 1, 1, 0, 0, 1)])
+        # Start from an empty cache; patch restores the real one afterwards
+        with patch("app.formatters.output_formatter._last_ts_str", ""), \
+             patch("app.formatters.output_formatter._last_ts_ns", 0), \
+             patch("app.formatters.output_formatter.time.monotonic_ns", lambda: next(clock)), \
+             patch("app.formatters.output_formatter._utcnow", lambda: next(times)):
+            first = format_progress("convert", percent=10.0)
+            # 1ms later: within the TTL, reused
+            second = format_progress("convert", percent=20.0)
+            # 1s later: expired, formatted afresh
+            third = format_progress("convert", percent=30.0)
+
+        assert first["timestamp"] == second["timestamp"] == "2024-01-01T00:00:00Z"
+        assert third["timestamp"] == "2024-01-01T00:00:01Z"
+
+        pinned = format_progress("convert", percent=30.0, timestamp="2024-01-01T00:00:00Z")
+        assert pinned["timestamp"] == "2024-01-01T00:00:00Z"
+
 class TestPathFormatter:
     def test_sanitize_filename(self):
         assert sanitize_filename("test/file.mp3") == "test_file.mp3" # sanitize replaces / with _
@@ -49,8 +72,27 @@ class TestPathFormatter:
         # Request same path
         p2 = ensure_unique_path(tmp_path / "test.txt")
         assert p2.name == "test_1.txt"
+        # The returned path is claimed on disk
+        assert p2.exists()
         
         # Create that one too
         p2.touch()
         p3 = ensure_unique_path(tmp_path / "test.txt")
         assert p3.name == "test_2.txt"
+
+        # A missing parent is created and the path still claimed
+        p4 = ensure_unique_path(tmp_path / "new" / "test.txt")
+        assert p4 == tmp_path / "new" / "test.txt"
+        assert p4.exists()
+
+    def test_generate_output_path(self, tmp_path):
+        out = generate_output_path("/music/song.wav", str(tmp_path), "mp3", "_mastered")
+        assert out == str(tmp_path / "song_mastered.mp3")
+
+        (tmp_path / "song_mastered.mp3").touch()
+        out = generate_output_path("/music/song.wav", str(tmp_path), ".mp3", "_mastered")
+        assert out == str(tmp_path / "song_mastered_1.mp3")
+
+        # Keeps the original extension when no format is given
+        out = generate_output_path("/music/song.flac", str(tmp_path))
+        assert out == str(tmp_path / "song.flac")
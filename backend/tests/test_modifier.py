@@ -1,12 +1,15 @@
 """Unit tests for the modifier module."""
 
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from app.handler.modifier import (
     ModificationRequest,
     process,
-    build_filter_complex
+    build_filter_complex,
+    build_stream_command,
+    get_audio_info,
 )
 
 class TestModifier:
@@ -34,6 +37,25 @@ class TestModifier:
         src, dst = outputs[0]
         assert dst.name == "music_modified.wav"
 
+    def test_modification_request_outputs_ignore_case(self, tmp_path):
+        input_file = tmp_path / "music.mp3"
+        input_file.touch()
+        output_dir = tmp_path / "modified"
+        output_dir.mkdir()
+        (output_dir / "Music_Modified.WAV").touch()
+
+        req = ModificationRequest(
+            input_paths=[input_file],
+            output_directory=output_dir,
+            speed=1.5,
+            pitch=0,
+            cut_start=0,
+            cut_end=100
+        )
+
+        _, dst = next(iter(req.outputs()))
+        assert dst.name == "music_modified (1).wav"
+
     def test_build_filter_complex(self):
         # Test speed only
         f1 = build_filter_complex(speed=1.5, pitch=0, sample_rate=44100)
@@ -52,6 +74,10 @@ class TestModifier:
         # Combined might vary in implementation order, but should contain both logic
         assert "atempo" in f3
 
+        # Out-of-range speed is split into chained atempo stages
+        f4 = build_filter_complex(speed=5.0, pitch=0, sample_rate=44100)
+        assert f4 == "atempo=2.0,atempo=2.0,atempo=1.25"
+
     def test_process_success(self, tmp_path, mock_subprocess):
         input_file = tmp_path / "music.mp3"
         input_file.touch()
@@ -77,9 +103,71 @@ class TestModifier:
             assert len(outputs) == 1
             assert mock_subprocess.run.call_count == 1
             
-            # Verify cut args
+            # Verify cut args: input-side seek by default
             args = mock_subprocess.run.call_args[0][0]
-            assert "-ss" in args
+            assert args.index("-ss") < args.index("-i")
             assert "10.0" in args # 10% of 100s
-            assert "-to" in args
-            assert "90.0" in args # 90% of 100s
+            assert "-t" in args
+            assert "80.0" in args # 90% - 10% of 100s
+
+            # Single job: FFmpeg may use every core
+            assert args[args.index("-threads") + 1] == str(os.cpu_count() or 1)
+
+            # Cut only: stream copy into the source container
+            assert args[args.index("-c") + 1] == "copy"
+            assert outputs[0].name == "music_modified.mp3"
+
+    def test_process_accurate_cut(self, tmp_path, mock_subprocess):
+        input_file = tmp_path / "music.mp3"
+        input_file.touch()
+
+        req = ModificationRequest(
+            input_paths=[input_file],
+            output_directory=tmp_path / "modified",
+            speed=1.0,
+            pitch=0,
+            cut_start=10,
+            cut_end=90,
+            accurate_cut=True
+        )
+        mock_subprocess.check_output.return_value = b'{"streams": [{"duration": "100.0", "sample_rate": "44100"}]}'
+
+        with patch("app.handler.modifier.resolve_environment"), \
+             patch("app.handler.modifier.validate_input_paths"):
+            process(req)
+
+        args = mock_subprocess.run.call_args[0][0]
+        assert args.index("-ss") > args.index("-i")
+        assert "-to" in args
+        assert "90.0" in args
+        # Sample-exact cuts are re-encoded, never stream-copied
+        assert "-c" not in args
+
+    def test_get_audio_info_single_probe_cached(self, tmp_path, mock_subprocess):
+        input_file = tmp_path / "music.mp3"
+        input_file.touch()
+        mock_subprocess.check_output.return_value = b'{"streams": [{"duration": "12.5", "sample_rate": "48000"}]}'
+
+        first = get_audio_info(input_file)
+        second = get_audio_info(input_file)
+
+        assert first == second == {"duration": 12.5, "sample_rate": 48000}
+        assert mock_subprocess.check_output.call_count == 1
+
+    def test_build_stream_command(self, tmp_path, mock_subprocess):
+        input_file = tmp_path / "music.mp3"
+        input_file.touch()
+        mock_subprocess.check_output.return_value = b'{"streams": [{"duration": "100.0", "sample_rate": "44100"}]}'
+
+        req = ModificationRequest(
+            input_paths=[input_file],
+            output_directory=tmp_path,
+            speed=1.5,
+            pitch=0,
+            cut_start=0,
+            cut_end=100
+        )
+        cmd = build_stream_command(req, input_file)
+
+        assert cmd[-5:] == ["-f", "wav", "-c:a", "pcm_s16le", "pipe:1"]
+        assert "atempo=1.5" in cmd
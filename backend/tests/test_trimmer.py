@@ -6,9 +6,17 @@ from unittest.mock import MagicMock, patch
 from app.handler.trimmer import (
     SilenceTrimmer,
     TrimRequest,
-    TrimResult
+    TrimResult,
+    _nonsilent_bounds
 )
 
+@pytest.fixture(scope="module")
+def sample_wav(tmp_path_factory):
+    """Input file shared by the module; tests only read it."""
+    path = tmp_path_factory.mktemp("audio") / "speech.wav"
+    path.touch()
+    return path
+
 class TestTrimmer:
     @pytest.fixture
     def mock_pydub(self):
@@ -20,9 +28,8 @@ class TestTrimmer:
         with patch("app.handler.trimmer.silence") as mock:
             yield mock
 
-    def test_trim_request_outputs(self, tmp_path):
-        input_file = tmp_path / "speech.wav"
-        input_file.touch()
+    def test_trim_request_outputs(self, tmp_path, sample_wav):
+        input_file = sample_wav
         output_dir = tmp_path / "trimmed"
         
         req = TrimRequest(
@@ -35,9 +42,8 @@ class TestTrimmer:
         src, dst = outputs[0]
         assert dst.name == "speech.wav"
 
-    def test_process_success(self, tmp_path, mock_pydub, mock_silence):
-        input_file = tmp_path / "speech.wav"
-        input_file.touch()
+    def test_process_success(self, tmp_path, sample_wav, mock_pydub, mock_silence):
+        input_file = sample_wav
         output_dir = tmp_path / "trimmed"
         
         req = TrimRequest(
@@ -65,9 +71,8 @@ class TestTrimmer:
             assert len(result.outputs) == 1
             mock_audio.export.assert_called_once()
 
-    def test_no_silence_detected(self, tmp_path, mock_pydub, mock_silence):
-        input_file = tmp_path / "speech.wav"
-        input_file.touch()
+    def test_no_silence_detected(self, tmp_path, sample_wav, mock_pydub, mock_silence):
+        input_file = sample_wav
         output_dir = tmp_path / "trimmed"
         
         req = TrimRequest(
@@ -87,3 +92,57 @@ class TestTrimmer:
             assert result.success is True
             # Should export original audio
             mock_audio.export.assert_called_once()
+
+    def test_seek_step_forwarded(self, tmp_path, sample_wav, mock_pydub, mock_silence):
+        input_file = sample_wav
+
+        req = TrimRequest(
+            input_paths=[input_file],
+            output_directory=tmp_path / "trimmed",
+            seek_step=25
+        )
+
+        mock_audio = MagicMock()
+        mock_pydub.from_file.return_value = mock_audio
+        mock_silence.detect_nonsilent.return_value = []
+
+        with patch("app.handler.trimmer.validate_pydub_available"), \
+             patch("app.handler.trimmer.resolve_environment"):
+            SilenceTrimmer.process(req)
+
+        _, kwargs = mock_silence.detect_nonsilent.call_args
+        assert kwargs["seek_step"] == 25
+
+    def test_nonsilent_bounds_from_silencedetect(self):
+        header = b"  Duration: 00:00:10.00, start: 0.000000, bitrate: 1411 kb/s\n"
+        edges = (
+            b"[silencedetect @ 0x1] silence_start: 0\n"
+            b"[silencedetect @ 0x1] silence_end: 1.5 | silence_duration: 1.5\n"
+            b"[silencedetect @ 0x1] silence_start: 4\n"
+            b"[silencedetect @ 0x1] silence_end: 5 | silence_duration: 1\n"
+            b"[silencedetect @ 0x1] silence_start: 8.2\n"
+        )
+        assert _nonsilent_bounds(header + edges) == (1.5, 8.2)
+        assert _nonsilent_bounds(header) == (0.0, None)
+        # Entirely silent input is kept whole
+        assert _nonsilent_bounds(
+            header + b"silence_start: 0\nsilence_end: 10 | silence_duration: 10\n"
+        ) == (0.0, None)
+
+    def test_fast_detect_nonsilent_matches_pydub(self):
+        np = pytest.importorskip("numpy")
+        from pydub import AudioSegment, silence
+        from app.handler.trimmer import _fast_detect_nonsilent
+
+        # 0.5s silence, 1s noise, 0.3s silence, 0.2s noise, 0.5s silence
+        rng = np.random.default_rng(0)
+        frames = np.zeros((2500 * 8, 2), dtype="<i2")
+        frames[4000:12000] = rng.normal(0, 3000, (8000, 2))
+        frames[14400:16000] = rng.normal(0, 3000, (1600, 2))
+        audio = AudioSegment(frames.tobytes(), sample_width=2, frame_rate=8000, channels=2)
+
+        for min_silence, step in ((100, 1), (250, 7), (600, 1)):
+            expected = silence.detect_nonsilent(
+                audio, min_silence_len=min_silence, silence_thresh=-40.0, seek_step=step
+            )
+            assert _fast_detect_nonsilent(audio, min_silence, -40.0, step) == expected
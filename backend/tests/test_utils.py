@@ -2,6 +2,7 @@
 
 import pytest
 from app.utils.audio_utils import db_to_float, float_to_db, ms_to_samples
+from app.utils.file_utils import list_audio_files, safe_delete
 from app.utils.string_utils import slugify, format_duration
 
 class TestAudioUtils:
@@ -17,11 +18,51 @@ class TestAudioUtils:
         assert ms_to_samples(1000, 44100) == 44100
         assert ms_to_samples(500, 48000) == 24000
 
+    def test_sequence_inputs(self):
+        assert list(db_to_float([0, -6])) == pytest.approx([1.0, 0.501], rel=0.01)
+        assert list(float_to_db([1.0, 0.0])) == [0.0, -float('inf')]
+        assert list(ms_to_samples([1000, 500], 48000)) == [48000, 24000]
+
+class TestFileUtils:
+    def test_list_audio_files(self, tmp_path):
+        (tmp_path / "a.mp3").touch()
+        (tmp_path / "B.WAV").touch()
+        (tmp_path / "notes.txt").touch()
+        (tmp_path / ".mp3").touch()
+        nested = tmp_path / "album.flac"
+        nested.mkdir()
+        (nested / "c.flac").touch()
+
+        flat = sorted(p.name for p in list_audio_files(tmp_path))
+        assert flat == ["B.WAV", "a.mp3"]
+
+        deep = sorted(p.name for p in list_audio_files(tmp_path, recursive=True))
+        assert deep == ["B.WAV", "a.mp3", "c.flac"]
+        assert list_audio_files(tmp_path / "missing") == []
+
+    def test_safe_delete(self, tmp_path):
+        f = tmp_path / "a.wav"
+        f.touch()
+        folder = tmp_path / "folder"
+        folder.mkdir()
+        (folder / "b.wav").touch()
+
+        assert safe_delete(f) is True
+        assert safe_delete(folder) is True
+        assert safe_delete(tmp_path / "missing") is True
+        assert not f.exists() and not folder.exists()
+
 class TestStringUtils:
     def test_slugify(self):
         assert slugify("Hello World") == "hello-world"
-        assert slugify("Test_File.mp3") == "test-filemp3"
-        assert slugify("Café") == "cafe"
+        assert slugify("Test_File.mp3") == "test-file-mp3"
+        assert slugify("Café") == "café"
+        assert slugify("  Straße -- 東京! ") == "strasse-東京"
+
+    def test_slugify_ascii_only(self):
+        assert slugify("Hello World", ascii_only=True) == "hello-world"
+        assert slugify("Test_File.mp3", ascii_only=True) == "test-filemp3"
+        assert slugify("Café", ascii_only=True) == "cafe"
         
     def test_format_duration(self):
         assert format_duration(65) == "01:05"
@@ -1,11 +1,14 @@
 """Unit tests for validator modules."""
 
 import pytest
+from unittest.mock import patch
 from app.validators.audio_validator import (
     validate_audio_file,
+    validate_audio_files,
     check_file_format,
     verify_file_size,
-    validate_path
+    validate_path,
+    clear_path_cache
 )
 from app.validators.format_validator import (
     is_valid_format,
@@ -14,7 +17,10 @@ from app.validators.format_validator import (
 )
 from app.validators.parameter_validator import (
     validate_conversion_params,
-    validate_mastering_params
+    validate_mastering_params,
+    validate_analysis_params,
+    validate_modify_params,
+    validate_trim_params
 )
 
 class TestAudioValidator:
@@ -30,6 +36,25 @@ class TestAudioValidator:
         assert valid is False
         assert "does not exist" in err
 
+    def test_validate_path_missing_cached_until_cleared(self, tmp_path):
+        f = tmp_path / "later.mp3"
+        assert validate_path(str(f))[0] is False
+
+        f.touch()
+        # Still reported missing within the TTL
+        assert validate_path(str(f))[0] is False
+
+        clear_path_cache()
+        assert validate_path(str(f)) == (True, None)
+
+    def test_validate_audio_file_sees_new_file(self, tmp_path):
+        f = tmp_path / "written.mp3"
+        assert validate_path(str(f))[0] is False
+
+        # Full validation is not subject to validate_path's negative cache
+        f.write_bytes(b"0")
+        assert validate_audio_file(f) == (True, None)
+
     def test_check_file_format_valid(self):
         valid, err = check_file_format("song.mp3")
         assert valid is True
@@ -49,6 +74,49 @@ class TestAudioValidator:
         valid, err = verify_file_size(f, max_size_mb=1)
         assert valid is True
 
+    def test_validate_audio_files_batch(self, tmp_path):
+        a = tmp_path / "a.mp3"
+        b = tmp_path / "b.wav"
+        a.write_bytes(b"0" * 16)
+        b.write_bytes(b"0" * 16)
+        missing = tmp_path / "missing.mp3"
+
+        results = validate_audio_files([a, missing, str(b), tmp_path / "notes.txt"])
+
+        assert results[0] == (True, None)
+        assert results[1][0] is False and "does not exist" in results[1][1]
+        assert results[2] == (True, None)
+        assert results[3][0] is False
+        assert validate_audio_file(a) == (True, None)
+
+    def test_validate_audio_files_across_directories(self, tmp_path):
+        paths = []
+        for i in range(4):
+            folder = tmp_path / f"d{i}"
+            folder.mkdir()
+            paths.append(folder / f"t{i}.mp3")
+            paths[-1].write_bytes(b"0")
+        paths.append(tmp_path / "d9" / "gone.mp3")
+
+        results = validate_audio_files(paths, max_workers=4)
+
+        assert [valid for valid, _ in results] == [True, True, True, True, False]
+
+    def test_validate_audio_file_cached_until_changed(self, tmp_path):
+        f = tmp_path / "cached.mp3"
+        f.write_bytes(b"0")
+
+        with patch(
+            "app.validators.audio_validator.check_file_format", wraps=check_file_format
+        ) as spy:
+            validate_audio_file(f)
+            validate_audio_file(f)
+            assert spy.call_count == 1
+
+            f.write_bytes(b"00")
+            validate_audio_file(f)
+            assert spy.call_count == 2
+
 class TestFormatValidator:
     def test_is_valid_format(self):
         assert is_valid_format("mp3") is True
@@ -72,6 +140,39 @@ class TestParameterValidator:
         valid, err = validate_conversion_params(params)
         assert valid is True
 
+    def test_validate_conversion_params_concurrent_files(self):
+        assert validate_conversion_params({"format": "mp3", "concurrent_files": 4})[0] is True
+        assert validate_conversion_params({"format": "mp3", "concurrent_files": 0})[0] is False
+        assert validate_conversion_params({"format": "mp3", "concurrent_files": "x"})[0] is False
+
+    def test_validate_conversion_params_cached(self):
+        with patch(
+            "app.validators.parameter_validator.is_valid_format", return_value=True
+        ) as spy:
+            params = {"format": "ogg", "bitrate": "160k"}
+            assert validate_conversion_params(dict(params, files=["a.wav"]))[0] is True
+            assert validate_conversion_params(dict(params, files=["b.wav"]))[0] is True
+            assert spy.call_count == 1
+
+            # Unhashable values are still validated, just not cached
+            assert validate_conversion_params({"format": "ogg", "bitrate": ["x"]})[0] is False
+
+    def test_validate_analysis_params_concurrent_files(self):
+        assert validate_analysis_params({"concurrent_files": 2}) == (True, None)
+        assert validate_analysis_params({"concurrent_files": "x"})[0] is False
+
+    def test_validate_numbers_nan_and_inf(self):
+        # Unbounded: accepted as before
+        assert validate_modify_params({"pitch": "nan"}) == (True, None)
+        assert validate_modify_params({"pitch": "inf"}) == (True, None)
+        # Bounded: rejected with the range message, never an empty one
+        assert validate_modify_params({"speed": "nan"}) == (False, "Speed must be between 0.1 and 10.0")
+        assert validate_modify_params({"speed": float("inf")}) == (False, "Speed must be between 0.1 and 10.0")
+        # int(inf) overflows; reported as a type error
+        assert validate_trim_params({"min_silence_len": float("inf")}) == (
+            False, "Minimum silence length must be an integer"
+        )
+
     def test_validate_conversion_params_missing_format(self):
         params = {"bitrate": "192k"}
         valid, err = validate_conversion_params(params)
@@ -15,11 +15,38 @@ Typical usage:
 """
 from __future__ import annotations
 
+import atexit
 import os
+import shutil
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
+from time import (
+    gmtime as _gmtime,
+    monotonic as _monotonic,
+    strftime as _strftime,
+    time as _time,
+)
 from typing import Optional
 
+# Imported once here rather than on every discovery call
+try:
+    from pydub import AudioSegment as _AudioSegment  # type: ignore
+except ModuleNotFoundError:
+    _AudioSegment = None
+
+
+# Binary names to look for in a candidate directory, in priority order
+_FFMPEG_NAMES = tuple(os.path.normcase(name) for name in (
+    "ffmpeg.exe",
+    "ffmpeg",
+    "ffmpeg-aarch64-apple-darwin",  # macOS ARM64
+    "ffmpeg-x86_64-apple-darwin",     # macOS Intel
+    "ffmpeg-x86_64-pc-windows-msvc.exe",  # Windows
+    "avconv",
+))
+
 
 def _candidate_directories() -> list[Path]:
     """Return possible locations for the bundled FFmpeg binary.
@@ -52,25 +79,65 @@ def _candidate_directories() -> list[Path]:
         env_path = Path(env_bin_dir)
         env_candidates.extend([env_path, env_path / "ffmpeg", env_path / "bin"])
 
+    return env_candidates + list(_BUNDLED_DIRECTORIES)
+
+
+def _bundled_directories() -> tuple[Path, ...]:
+    """Return the fixed bundle/source-tree candidates (no environment part)."""
     if hasattr(sys, "_MEIPASS"):
         runtime_root = Path(getattr(sys, "_MEIPASS"))
-        return env_candidates + [
+        return (
             runtime_root / "src-tauri" / "bin" / "ffmpeg",
             runtime_root / "src-tauri" / "bin",
             runtime_root / "backend" / "resources" / "bin",
             runtime_root / "resources" / "bin",
             runtime_root / "bin",
-        ]
+        )
 
     current_dir = Path(__file__).resolve().parent
     project_root = current_dir.parent
-    return env_candidates + [
+    return (
         project_root / "src-tauri" / "binaries",  # New binaries location
         project_root / "src-tauri" / "bin" / "ffmpeg",
         project_root / "src-tauri" / "bin",
         current_dir / "resources" / "bin",
         current_dir.parent / "resources" / "bin",
-    ]
+    )
+
+
+def _first_existing_directory(candidates: list[Path]) -> Optional[Path]:
+    """Return the first candidate that is a directory.
+
+    Each parent is listed once and candidate names are matched in memory,
+    case-insensitively (``normcase`` alone is a no-op on macOS), instead
+    of a ``stat`` per candidate. Only candidates whose parent cannot be
+    listed (e.g. traversable but unreadable) are checked with ``is_dir()``.
+    """
+    listings: dict[Path, Optional[frozenset[str]]] = {}
+    for candidate in candidates:
+        parent = candidate.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = frozenset(
+                        os.path.normcase(entry.name).casefold()
+                        for entry in entries
+                        if entry.is_dir()
+                    )
+            except OSError:
+                listings[parent] = None
+        names = listings[parent]
+        if names is None:
+            if candidate.is_dir():
+                return candidate
+        elif os.path.normcase(candidate.name).casefold() in names:
+            return candidate
+    return None
+
+
+# Built once at import: the bundle layout cannot change while running, and
+# PyInstaller sets sys._MEIPASS before any module is imported
+_BUNDLED_DIRECTORIES = _bundled_directories()
 
 
 def ensure_ffmpeg() -> Optional[Path]:
@@ -80,6 +147,10 @@ def ensure_ffmpeg() -> Optional[Path]:
         1. FFMPEG_BINARY environment variable (if set)
         2. Bundled FFmpeg in various candidate directories
         3. System FFmpeg (via PATH)
+
+    Outside a bundle and without SOUNDCONVERTER_BIN_DIR (i.e. development
+    runs), a system FFmpeg on PATH is checked before the source-tree
+    candidate directories.
     
     When found, the FFmpeg binary path is registered with pydub's AudioSegment
     and added to the system PATH for subprocess access.
@@ -105,62 +176,103 @@ def ensure_ffmpeg() -> Optional[Path]:
         - Sets pydub.AudioSegment.converter
         - Modifies os.environ["PATH"]
         - Logs discovery status via log_message()
+
+        Discovery runs once per process for a given set of the environment
+        inputs it depends on; later calls return the cached result.
     """
-    
+    return _discover_ffmpeg(
+        os.environ.get("FFMPEG_BINARY"),
+        os.environ.get("SOUNDCONVERTER_BIN_DIR"),
+        getattr(sys, "_MEIPASS", None),
+    )
+
+
+@lru_cache(maxsize=1)
+def _discover_ffmpeg(
+    ffmpeg_binary_env: Optional[str],
+    bin_dir_env: Optional[str],
+    meipass: Optional[str],
+) -> Optional[Path]:
+    """Locate FFmpeg; the arguments key the cache so env changes re-run it."""
     # First priority: Check FFMPEG_BINARY environment variable
-    ffmpeg_binary_env = os.environ.get("FFMPEG_BINARY")
     if ffmpeg_binary_env:
         ffmpeg_path = Path(ffmpeg_binary_env)
         if ffmpeg_path.is_file() and ffmpeg_path.exists():
             log_message("python", f"Using FFmpeg from FFMPEG_BINARY: {ffmpeg_path}")
-            try:
-                from pydub import AudioSegment  # type: ignore
-                AudioSegment.converter = str(ffmpeg_path)
-            except ModuleNotFoundError:
-                pass
+            if _AudioSegment is not None:
+                _AudioSegment.converter = str(ffmpeg_path)
             return ffmpeg_path
 
-    try:
-        from pydub import AudioSegment  # type: ignore
-    except ModuleNotFoundError:
+    if _AudioSegment is None:
         # ``pydub`` is optional at startup; conversion will report a clearer
         # error message if the dependency is missing.
         return None
 
-    candidate_dirs = _candidate_directories()
-    binary_dir = next((d for d in candidate_dirs if d.is_dir()), None)
+    # Development runs (no bundle, no bin dir override): an FFmpeg already on
+    # PATH is found with one PATH walk instead of probing every candidate
+    if not bin_dir_env and not meipass:
+        system_ffmpeg = shutil.which("ffmpeg")
+        if system_ffmpeg:
+            _AudioSegment.converter = system_ffmpeg
+            return Path(system_ffmpeg)
+
+    binary_dir = _first_existing_directory(_candidate_directories())
 
     if not binary_dir:
         return None
 
-    candidates = [
-        binary_dir / "ffmpeg.exe",
-        binary_dir / "ffmpeg",
-        binary_dir / "ffmpeg-aarch64-apple-darwin",  # macOS ARM64
-        binary_dir / "ffmpeg-x86_64-apple-darwin",     # macOS Intel
-        binary_dir / "ffmpeg-x86_64-pc-windows-msvc.exe",  # Windows
-        binary_dir / "avconv",
-    ]
-    binary_path = next((path for path in candidates if path.is_file()), None)
+    # One directory listing instead of a stat per candidate name
+    try:
+        with os.scandir(binary_dir) as entries:
+            files = {
+                os.path.normcase(entry.name): entry.path
+                for entry in entries
+                if entry.is_file()
+            }
+    except OSError:
+        return None
+
+    binary_path = next(
+        (Path(files[name]) for name in _FFMPEG_NAMES if name in files), None
+    )
     if binary_path is None:
         return None
 
-    path_entries = os.environ.get("PATH", "").split(os.pathsep) if os.environ.get("PATH") else []
+    path_env = os.environ.get("PATH", "")
     binary_dir_str = str(binary_dir)
-    if binary_dir_str not in path_entries:
-        path_entries.insert(0, binary_dir_str)
-        os.environ["PATH"] = os.pathsep.join(path_entries) if path_entries else binary_dir_str
+    # Bracketing with separators makes one substring search an exact
+    # entry match, without splitting PATH into a list
+    if f"{os.pathsep}{binary_dir_str}{os.pathsep}" not in f"{os.pathsep}{path_env}{os.pathsep}":
+        os.environ["PATH"] = f"{binary_dir_str}{os.pathsep}{path_env}" if path_env else binary_dir_str
 
-    AudioSegment.converter = str(binary_path)
+    _AudioSegment.converter = str(binary_path)
     return binary_path
 
 
+# Log lines are batched into one stderr write; a flush happens once this
+# many characters are pending, once the oldest is this old (seconds, checked
+# on the next line; monotonic clock), for error scopes, and at exit
+_LOG_FLUSH_BYTES = 4096
+_LOG_FLUSH_INTERVAL = 0.25
+_LOG_URGENT_SCOPES = frozenset({"error", "fatal"})
+_log_buffer: list[str] = []
+_log_size = 0
+_log_last_flush = 0.0
+_log_lock = threading.Lock()
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last log line;
+# one tuple so concurrent loggers never see a mismatched pair
+_last_log_second = (-1, "")
+
+
 def log_message(scope: str, message: str) -> None:
     """Emit structured log messages to stderr.
     
     Outputs log messages in a structured format with timestamp and scope.
-    All messages are written to stderr with immediate flushing to ensure
-   they appear in real-time during processing.
+    Messages are buffered and written to stderr in batches: at most every
+    ``_LOG_FLUSH_INTERVAL`` seconds while logging continues, immediately for
+    the "error" and "fatal" scopes, and at exit. Call ``flush_log()`` to
+    push pending lines out sooner (e.g. when a request completes).
     
     Args:
         scope: The logging scope/category (e.g., "python", "ffmpeg", "app").
@@ -184,8 +296,41 @@ def log_message(scope: str, message: str) -> None:
         Uses UTC timestamps in ISO 8601 format for consistency across
         timezones and easy parsing.
     """
+    global _last_log_second, _log_size
+
+    now = _time()
+    second = int(now)
+    cached_second, prefix = _last_log_second
+    if second != cached_second:
+        # libc strftime, re-run at most once per second
+        prefix = _strftime("%Y-%m-%dT%H:%M:%S", _gmtime(second))
+        _last_log_second = (second, prefix)
+    timestamp = f"{prefix}.{int((now - second) * 1000):03d}Z"
+    line = f"[{scope}] [{timestamp}] {message}\n"
+
+    with _log_lock:
+        _log_buffer.append(line)
+        _log_size += len(line)
+        due = (
+            _log_size >= _LOG_FLUSH_BYTES
+            or _monotonic() - _log_last_flush >= _LOG_FLUSH_INTERVAL
+            or scope in _LOG_URGENT_SCOPES
+        )
+    if due:
+        flush_log()
+
+
+def flush_log() -> None:
+    """Write any buffered log lines to stderr in one call."""
+    global _log_size, _log_last_flush
+    with _log_lock:
+        if _log_buffer:
+            stream = sys.stderr
+            stream.write("".join(_log_buffer))
+            stream.flush()
+            _log_buffer.clear()
+            _log_size = 0
+        _log_last_flush = _monotonic()
 
-    from datetime import datetime
 
-    timestamp = f"{datetime.utcnow().isoformat()}Z"
-    print(f"[{scope}] [{timestamp}] {message}", file=sys.stderr, flush=True)
+atexit.register(flush_log)
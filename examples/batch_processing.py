@@ -4,10 +4,13 @@ This script demonstrates how to process multiple files concurrently
 using the Harmonix SE backend modules.
 """
 
+import multiprocessing
+import os
 import sys
 import time
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
 
 # Add backend to path
 sys.path.append(str(Path(__file__).parent.parent / "backend"))
@@ -16,13 +19,41 @@ from app.handler.converter import SoundConverter, ConversionRequest
 from app.utils.file_utils import list_audio_files
 from utils import ensure_ffmpeg
 
-def process_single_file(file_path: Path, output_dir: Path) -> dict:
-    """Process a single file and return result dict."""
+# Per-worker state, set once by the pool initializer
+_FFMPEG_PATH = None
+
+def _init_worker(worker_counter=None):
+    """Resolve FFmpeg once per worker process and pin it to its own core."""
+    global _FFMPEG_PATH
+    _FFMPEG_PATH = ensure_ffmpeg()
+
+    # Linux only: one core per worker keeps its buffers cache-local. The
+    # FFmpeg children inherit the affinity, as with one job per core.
+    if worker_counter is not None and hasattr(os, "sched_setaffinity"):
+        with worker_counter.get_lock():
+            index = worker_counter.value
+            worker_counter.value += 1
+        cores = sorted(os.sched_getaffinity(0))
+        try:
+            os.sched_setaffinity(0, {cores[index % len(cores)]})
+        except OSError:
+            pass
+
+def process_single_file(file_path: str, output_dir: str) -> dict:
+    """Process a single file and return result dict.
+
+    Runs in a worker process, so it takes and returns only picklable values.
+    """
+    file_path = Path(file_path)
     request = ConversionRequest(
         input_paths=[file_path],
-        output_directory=output_dir,
+        output_directory=Path(output_dir),
         output_format="flac",
-        ffmpeg_path=ensure_ffmpeg()
+        ffmpeg_path=_FFMPEG_PATH,
+        # The pool already runs one process per core; one FFmpeg thread
+        # each keeps the machine from being oversubscribed
+        max_workers=1,
+        threads_per_process=1
     )
     
     start_time = time.time()
@@ -34,8 +65,8 @@ def process_single_file(file_path: Path, output_dir: Path) -> dict:
             "file": file_path.name,
             "success": result.success,
             "duration": duration,
-            "output": result.output_path if result.success else None,
-            "error": result.error
+            "output": str(result.outputs[0]) if result.outputs else None,
+            "error": None if result.success else result.message
         }
     except Exception as e:
         return {
@@ -63,24 +94,37 @@ def main():
         
     print(f"Found {len(files)} files. Starting processing...")
     
-    # Process concurrently
-    results = []
-    max_workers = 4
+    # Process concurrently; separate processes so Python-side work in one
+    # job never holds up another behind the GIL
+    # Running tally; per-file lines are printed as they finish
+    success_count = 0
+    max_workers = os.cpu_count() or 1
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_file = {
-            executor.submit(process_single_file, f, output_dir): f 
-            for f in files
+    # Each worker resolves FFmpeg once up front and reuses it for every file
+    worker_counter = multiprocessing.Value("i", 0)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(worker_counter,)
+    ) as executor:
+        # Keep at most two jobs per worker in flight so memory stays flat
+        # however many files there are
+        remaining = iter(files)
+        pending = {
+            executor.submit(process_single_file, str(f), str(output_dir))
+            for f in islice(remaining, 2 * max_workers)
         }
-        
-        for future in as_completed(future_to_file):
-            res = future.result()
-            results.append(res)
-            status = "✅" if res["success"] else "❌"
-            print(f"{status} {res['file']} ({res.get('duration', 0):.2f}s)")
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                res = future.result()
+                success_count += res["success"]
+                status = "✅" if res["success"] else "❌"
+                print(f"{status} {res['file']} ({res.get('duration', 0):.2f}s)")
+
+                for f in islice(remaining, 1):
+                    pending.add(executor.submit(process_single_file, str(f), str(output_dir)))
 
     # Summary
-    success_count = sum(1 for r in results if r["success"])
     print(f"\nCompleted: {success_count}/{len(files)} successful.")
 
 if __name__ == "__main__":